@@ -213,7 +213,7 @@ class GeminiService:
             )
 
             project_data_text = "\n".join(
-                format_project_for_prompt(p.model_dump()) for p in batch
+                format_project_for_prompt(p.as_dict()) for p in batch
             )
 
             prompt = SCORING_PROMPT_TEMPLATE.format(project_data=project_data_text)
@@ -36,6 +36,7 @@ from app.models.pptx import (
     SlideType,
     VisualizationType,
 )
+from app.services.http_client import get_http_client
 from app.services.sanity_validator import SanityValidator
 
 logger = logging.getLogger(__name__)
@@ -84,6 +85,7 @@ class OpenRouterService:
 
         # Initialize headers (always needed for error handling)
         self.headers = {}
+        self._client = get_http_client()
 
         if not self.api_key:
             logger.warning("OpenRouter API key not configured!")
@@ -137,73 +139,73 @@ class OpenRouterService:
         last_error = None
         
         for attempt in range(max_retries):
-            async with httpx.AsyncClient(timeout=180.0) as client:
+            try:
+                if attempt > 0:
+                    logger.info(f"Retry attempt {attempt + 1}/{max_retries}...")
+                    # Slight temperature increase on retry to get different output
+                    payload["temperature"] = min(temperature + (attempt * 0.1), 1.0)
+                
+                response = await self._client.post(
+                    f"{self.base_url}/chat/completions",
+                    headers=self.headers,
+                    json=payload,
+                    timeout=180.0,
+                )
+                response.raise_for_status()
+                
+                data = response.json()
+                
+                if "error" in data:
+                    error_msg = data.get("error", {})
+                    if isinstance(error_msg, dict):
+                        error_msg = error_msg.get("message", str(error_msg))
+                    last_error = OpenRouterError(f"OpenRouter API error: {error_msg}")
+                    logger.warning(f"API error on attempt {attempt + 1}: {error_msg}")
+                    continue
+                
+                if "choices" not in data or len(data["choices"]) == 0:
+                    logger.warning(f"OpenRouter response missing choices on attempt {attempt + 1}")
+                    last_error = OpenRouterError("No response choices returned")
+                    continue
+                
+                content = data["choices"][0]["message"]["content"]
+                
+                # Log response for debugging (truncated)
+                if content:
+                    logger.debug(f"OpenRouter response (first 500 chars): {content[:500]}")
+                else:
+                    logger.warning(f"OpenRouter returned empty content on attempt {attempt + 1}!")
+                    # Check for reasoning_content (DeepSeek R1 format)
+                    reasoning = data["choices"][0]["message"].get("reasoning_content", "")
+                    if reasoning:
+                        logger.info("DeepSeek R1 reasoning found, extracting from it...")
+                        content = reasoning
+                
+                if not content:
+                    last_error = OpenRouterError("OpenRouter returned empty response content")
+                    continue
+                
+                # Success!
+                return content
+                
+            except httpx.HTTPStatusError as e:
+                error_detail = ""
                 try:
-                    if attempt > 0:
-                        logger.info(f"Retry attempt {attempt + 1}/{max_retries}...")
-                        # Slight temperature increase on retry to get different output
-                        payload["temperature"] = min(temperature + (attempt * 0.1), 1.0)
-                    
-                    response = await client.post(
-                        f"{self.base_url}/chat/completions",
-                        headers=self.headers,
-                        json=payload,
-                    )
-                    response.raise_for_status()
-                    
-                    data = response.json()
-                    
-                    if "error" in data:
-                        error_msg = data.get("error", {})
-                        if isinstance(error_msg, dict):
-                            error_msg = error_msg.get("message", str(error_msg))
-                        last_error = OpenRouterError(f"OpenRouter API error: {error_msg}")
-                        logger.warning(f"API error on attempt {attempt + 1}: {error_msg}")
-                        continue
-                    
-                    if "choices" not in data or len(data["choices"]) == 0:
-                        logger.warning(f"OpenRouter response missing choices on attempt {attempt + 1}")
-                        last_error = OpenRouterError("No response choices returned")
-                        continue
-                    
-                    content = data["choices"][0]["message"]["content"]
-                    
-                    # Log response for debugging (truncated)
-                    if content:
-                        logger.debug(f"OpenRouter response (first 500 chars): {content[:500]}")
-                    else:
-                        logger.warning(f"OpenRouter returned empty content on attempt {attempt + 1}!")
-                        # Check for reasoning_content (DeepSeek R1 format)
-                        reasoning = data["choices"][0]["message"].get("reasoning_content", "")
-                        if reasoning:
-                            logger.info("DeepSeek R1 reasoning found, extracting from it...")
-                            content = reasoning
-                    
-                    if not content:
-                        last_error = OpenRouterError("OpenRouter returned empty response content")
-                        continue
-                    
-                    # Success!
-                    return content
-                    
-                except httpx.HTTPStatusError as e:
-                    error_detail = ""
-                    try:
-                        error_data = e.response.json()
-                        error_detail = error_data.get("error", {}).get("message", str(e))
-                    except:
-                        error_detail = str(e)
-                    last_error = OpenRouterError(f"OpenRouter HTTP error: {error_detail}")
-                    logger.warning(f"HTTP error on attempt {attempt + 1}: {error_detail}")
+                    error_data = e.response.json()
+                    error_detail = error_data.get("error", {}).get("message", str(e))
+                except:
+                    error_detail = str(e)
+                last_error = OpenRouterError(f"OpenRouter HTTP error: {error_detail}")
+                logger.warning(f"HTTP error on attempt {attempt + 1}: {error_detail}")
+                
+                # Don't retry on 4xx errors (except 429 rate limit)
+                if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
+                    raise last_error
                     
-                    # Don't retry on 4xx errors (except 429 rate limit)
-                    if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
-                        raise last_error
-                        
-                except httpx.RequestError as e:
-                    last_error = OpenRouterError(f"OpenRouter request failed: {e}")
-                    logger.warning(f"Request error on attempt {attempt + 1}: {e}")
-        
+            except httpx.RequestError as e:
+                last_error = OpenRouterError(f"OpenRouter request failed: {e}")
+                logger.warning(f"Request error on attempt {attempt + 1}: {e}")
+    
         # All retries exhausted
         raise last_error or OpenRouterError("All retry attempts failed")
 
@@ -356,7 +358,7 @@ class OpenRouterService:
             )
 
             project_data_text = "\n".join(
-                format_project_for_prompt(p.model_dump()) for p in batch
+                format_project_for_prompt(p.as_dict()) for p in batch
             )
 
             prompt = SCORING_PROMPT_TEMPLATE.format(project_data=project_data_text)
@@ -47,20 +47,23 @@ def _get_llm_service(
     2. Custom config API keys
     3. Default from environment config
     """
-    # Debug logging
-    has_custom_config = custom_config is not None
-    has_openrouter_key = bool(custom_config and custom_config.openrouter_key)
-    has_gemini_key = bool(custom_config and custom_config.gemini_key)
-    logger.debug(f"_get_llm_service: provider={llm_provider}, model={llm_model}, "
-                 f"has_config={has_custom_config}, has_openrouter_key={has_openrouter_key}, "
-                 f"has_gemini_key={has_gemini_key}")
+    # Debug logging (skipped entirely unless DEBUG is enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        has_custom_config = custom_config is not None
+        has_openrouter_key = bool(custom_config and custom_config.openrouter_key)
+        has_gemini_key = bool(custom_config and custom_config.gemini_key)
+        logger.debug(
+            "_get_llm_service: provider=%s, model=%s, has_config=%s, "
+            "has_openrouter_key=%s, has_gemini_key=%s",
+            llm_provider, llm_model, has_custom_config, has_openrouter_key, has_gemini_key,
+        )
     
     # If explicit provider is specified, use it
     if llm_provider:
         # Check for custom API keys
         if llm_provider == "openrouter":
             api_key = custom_config.openrouter_key if custom_config else None
-            logger.info(f"OpenRouter selected - API key provided: {bool(api_key)}")
+            logger.info("OpenRouter selected - API key provided: %s", bool(api_key))
             if api_key:
                 return OpenRouterService(api_key=api_key, model_name=llm_model)
             return get_llm_service(provider=LLMProvider.OPENROUTER, model=llm_model)
@@ -104,7 +107,9 @@ async def analyze_portfolio(request: AnalyzeRequest):
     # Determine provider for logging
     provider_name = request.llm_provider or "default"
     model_name = request.llm_model or "default"
-    logger.info(f"Starting portfolio analysis for: {portfolio_id} (LLM: {provider_name}/{model_name})")
+    logger.info(
+        "Starting portfolio analysis for: %s (LLM: %s/%s)", portfolio_id, provider_name, model_name
+    )
 
     try:
         # Initialize services
@@ -126,7 +131,7 @@ async def analyze_portfolio(request: AnalyzeRequest):
         actual_provider = type(llm_service).__name__
         actual_model = getattr(llm_service, 'model_name', 'unknown')
 
-        logger.info(f"Analysis completed in {duration:.1f}s using {actual_provider}")
+        logger.info("Analysis completed in %.1fs using %s", duration, actual_provider)
 
         return AnalyzeResponse(
             success=True,
@@ -143,21 +148,21 @@ async def analyze_portfolio(request: AnalyzeRequest):
         )
 
     except BlueAntClientError as e:
-        logger.error(f"BlueAnt error: {e}")
+        logger.error("BlueAnt error: %s", e)
         return AnalyzeResponse(
             success=False,
             error=f"BlueAnt Fehler: {e}",
         )
 
     except GeminiError as e:
-        logger.error(f"Gemini error: {e}")
+        logger.error("Gemini error: %s", e)
         return AnalyzeResponse(
             success=False,
             error=f"Gemini KI-Analyse Fehler: {e}",
         )
 
     except OpenRouterError as e:
-        logger.error(f"OpenRouter error: {e}")
+        logger.error("OpenRouter error: %s", e)
         return AnalyzeResponse(
             success=False,
             error=f"OpenRouter KI-Analyse Fehler: {e}",
@@ -165,14 +170,14 @@ async def analyze_portfolio(request: AnalyzeRequest):
 
     except ValueError as e:
         # Catches LLM configuration errors from factory
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         return AnalyzeResponse(
             success=False,
             error=f"Konfigurationsfehler: {e}",
         )
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return AnalyzeResponse(
             success=False,
             error=f"Unerwarteter Fehler: {e}",
@@ -9,6 +9,8 @@ from fastapi import APIRouter, HTTPException
 
 from app.api.schemas import (
     CustomConfig,
+    PortfolioDetail,
+    PortfolioDetailResponse,
     PortfolioSearchRequest,
     PortfolioSearchResponse,
     PortfolioSummary,
@@ -37,7 +39,7 @@ async def search_portfolios(request: PortfolioSearchRequest):
 
     Returns matching portfolios with basic info.
     """
-    logger.info(f"Searching portfolios for: {request.name}")
+    logger.info("Searching portfolios for: %s", request.name)
 
     try:
         blueant = _get_blueant(request.custom_config)
@@ -53,7 +55,7 @@ async def search_portfolios(request: PortfolioSearchRequest):
             for p in portfolios
         ]
 
-        logger.info(f"Found {len(results)} matching portfolios")
+        logger.info("Found %d matching portfolios", len(results))
 
         return PortfolioSearchResponse(
             success=True,
@@ -61,20 +63,20 @@ async def search_portfolios(request: PortfolioSearchRequest):
         )
 
     except BlueAntClientError as e:
-        logger.error(f"BlueAnt error during search: {e}")
+        logger.error("BlueAnt error during search: %s", e)
         return PortfolioSearchResponse(
             success=False,
             error=str(e),
         )
     except Exception as e:
-        logger.error(f"Unexpected error during search: {e}")
+        logger.error("Unexpected error during search: %s", e)
         return PortfolioSearchResponse(
             success=False,
             error=f"Unexpected error: {e}",
         )
 
 
-@router.get("/{portfolio_id}")
+@router.get("/{portfolio_id}", response_model=PortfolioDetailResponse)
 async def get_portfolio(portfolio_id: str):
     """
     Get portfolio details by ID.
@@ -83,16 +85,16 @@ async def get_portfolio(portfolio_id: str):
         blueant = get_blueant_service()
         portfolio = await blueant.get_portfolio(portfolio_id)
 
-        return {
-            "success": True,
-            "portfolio": {
-                "id": str(portfolio.id),
-                "name": portfolio.name,
-                "description": portfolio.description,
-                "project_count": len(portfolio.project_ids),
-                "project_ids": portfolio.project_ids,
-            },
-        }
+        return PortfolioDetailResponse(
+            success=True,
+            portfolio=PortfolioDetail(
+                id=str(portfolio.id),
+                name=portfolio.name,
+                description=portfolio.description,
+                project_count=len(portfolio.project_ids),
+                project_ids=portfolio.project_ids,
+            ),
+        )
 
     except BlueAntClientError as e:
         raise HTTPException(status_code=404, detail=f"Portfolio not found: {e}")
@@ -2,7 +2,7 @@
 API request/response schemas.
 """
 
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -51,6 +51,23 @@ class PortfolioSearchResponse(BaseModel):
     error: Optional[str] = None
 
 
+class PortfolioDetail(BaseModel):
+    """Portfolio details including its project IDs."""
+
+    id: str
+    name: str
+    description: Optional[str] = None
+    project_count: int = 0
+    project_ids: List[Union[int, str]] = Field(default_factory=list)
+
+
+class PortfolioDetailResponse(BaseModel):
+    """Response for a single portfolio."""
+
+    success: bool
+    portfolio: PortfolioDetail
+
+
 # =============================================================================
 # Analysis Endpoints
 # =============================================================================
@@ -1,35 +1,71 @@
 """
-Text-to-Speech API endpoint using edge-tts (free) or ElevenLabs (premium).
-Provides high-quality, natural-sounding German voices.
+Text-to-Speech API endpoint.
+Provides high-quality, natural-sounding German voices via the provider
+selected in settings (see app.services.tts_provider).
 """
 
+import json
 import logging
-import io
 import asyncio
-from typing import Optional
+import re
+from collections import deque
+from contextlib import aclosing
+from functools import lru_cache
+from typing import AsyncIterator, Awaitable, Callable, Deque, List, NamedTuple, Optional, Union
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-
-import edge_tts
+from starlette.background import BackgroundTask
 
 from app.config import get_settings
+from app.services.tts_cache import MEMORY_MAX_TEXT_LENGTH, get_tts_cache, make_cache_key
+from app.services.tts_provider import get_tts_provider
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/tts", tags=["text-to-speech"])
 
 
-# Edge-TTS German voices (free, high quality)
-EDGE_TTS_VOICES = {
-    "katja": "de-DE-KatjaNeural",        # Female - friendly, clear
-    "conrad": "de-DE-ConradNeural",      # Male - professional
-    "amala": "de-DE-AmalaNeural",        # Female - warm
-    "killian": "de-DE-KillianNeural",    # Male - calm
-}
+# Sentence boundaries for per-sentence caching of long texts
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+")
+SEGMENT_MIN_LENGTH = 40
+
+# Max seconds to wait for an identical in-flight synthesis before
+# synthesizing independently (covers owners whose stream is never consumed)
+SINGLE_FLIGHT_TIMEOUT = 30.0
+
+# Segments synthesized ahead of the one currently being streamed
+PREFETCH_SEGMENTS = 2
+
+
+@lru_cache
+def _get_tts_semaphore() -> asyncio.Semaphore:
+    """
+    Bounds concurrent provider syntheses; excess requests wait instead of failing.
+    Created on first use so settings are not read at import time.
+    """
+    return asyncio.Semaphore(get_settings().tts_max_concurrency)
+
+
+@lru_cache
+def _get_voices_json() -> bytes:
+    """Static /voices payload, serialized once on first use."""
+    provider = get_tts_provider()
+    return json.dumps(
+        {
+            "voices": provider.voices,
+            "default": provider.default_voice,
+            "provider": provider.label,
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
 
-DEFAULT_VOICE = EDGE_TTS_VOICES["katja"]
+
+@lru_cache
+def _get_valid_voices() -> frozenset:
+    """Voice IDs of the provider; unknown voices are rejected before any provider call."""
+    return frozenset(voice["id"] for voice in get_tts_provider().voices)
 
 
 class TTSRequest(BaseModel):
@@ -39,64 +75,218 @@ class TTSRequest(BaseModel):
     rate: Optional[str] = Field(default="+0%", description="Speech rate (e.g., '-10%', '+20%')")
 
 
+async def _provider_chunks(text: str, voice: str, rate: str) -> AsyncIterator[bytes]:
+    """
+    Yield MP3 chunks from the configured provider.
+    Holds a provider slot from the first chunk until the stream is closed.
+    """
+    async with _get_tts_semaphore():
+        async with aclosing(get_tts_provider().synthesize(text, voice, rate)) as chunks:
+            async for data in chunks:
+                yield data
+
+
+class _SegmentStream(NamedTuple):
+    """
+    Audio of a segment that is being synthesized (cache miss).
+    release() closes the provider stream and resolves single-flight waiters;
+    it must run even if chunks is never iterated.
+    """
+    chunks: AsyncIterator[bytes]
+    release: Callable[[], Awaitable[None]]
+
+
+def _split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentence segments that are synthesized and cached separately.
+    Fragments shorter than SEGMENT_MIN_LENGTH (e.g. after "z. B." or "Dr.")
+    are merged with their neighbours so the intonation is not broken up.
+    """
+    segments: List[str] = []
+    current = ""
+    for part in _SENTENCE_END.split(text.strip()):
+        current = f"{current} {part}" if current else part
+        if len(current) >= SEGMENT_MIN_LENGTH:
+            segments.append(current)
+            current = ""
+    if current:
+        if segments:
+            segments[-1] = f"{segments[-1]} {current}"
+        else:
+            segments.append(current)
+    return segments
+
+
+async def _segment_audio(text: str, voice: str, rate: str) -> Union[bytes, _SegmentStream]:
+    """
+    Open the audio for one segment.
+    Returns the cached MP3 bytes on a hit, otherwise a chunk stream. On a miss
+    the first chunk is already fetched, so synthesis errors are raised here
+    rather than mid-stream.
+    """
+    cache = get_tts_cache()
+    cache_key = make_cache_key(get_tts_provider().name, voice, rate, text)
+    keep_in_memory = len(text) <= MEMORY_MAX_TEXT_LENGTH
+    cached = await cache.get(cache_key, memory=keep_in_memory)
+
+    # Identical segment already being synthesized: wait for its result.
+    # If that synthesis fails (None), take over unless another waiter already did.
+    while cached is None:
+        in_flight = cache.join(cache_key)
+        if in_flight is None:
+            break
+        try:
+            cached = await asyncio.wait_for(asyncio.shield(in_flight), SINGLE_FLIGHT_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("TTS synthesis of %s still pending, synthesizing independently", cache_key[:12])
+            break
+
+    if cached is not None:
+        logger.info("TTS cache hit: %s", cache_key[:12])
+        return cached
+
+    future = cache.begin(cache_key)
+    try:
+        # Wait for the first audio chunk so synthesis errors still surface as HTTP 500
+        chunks = _provider_chunks(text, voice, rate)
+        try:
+            first_chunk = await chunks.__anext__()
+        except StopAsyncIteration:
+            raise HTTPException(status_code=500, detail="No audio data generated")
+    except BaseException:
+        cache.finish(cache_key, future, None)
+        raise
+
+    async def stream_audio():
+        try:
+            yield first_chunk
+            async for data in chunks:
+                yield data
+        finally:
+            # Release the provider slot promptly if the client goes away
+            await chunks.aclose()
+
+    stream = cache.tee(stream_audio(), cache_key, future, memory=keep_in_memory)
+
+    async def release():
+        # A never-started generator skips its finally blocks on aclose(),
+        # so close the provider stream and resolve the waiters explicitly
+        await stream.aclose()
+        await chunks.aclose()
+        cache.finish(cache_key, future, None)
+
+    return _SegmentStream(stream, release)
+
+
+async def _prefetch_segment(text: str, voice: str, rate: str) -> bytes:
+    """
+    Synthesize a whole segment ahead of playback (through the cache), so the
+    provider works on it while the previous segments are still streaming.
+    """
+    audio = await _segment_audio(text, voice, rate)
+    if isinstance(audio, bytes):
+        return audio
+    try:
+        return b"".join([data async for data in audio.chunks])
+    finally:
+        await audio.release()
+
+
 @router.post("/speak")
 async def text_to_speech(request: TTSRequest):
     """
-    Convert text to speech using edge-tts (free Microsoft Azure voices).
-    Returns audio as MP3 stream.
+    Convert text to speech using the configured provider (edge-tts by default).
+    Returns audio as MP3 stream; chunks are forwarded as the provider produces them.
+
+    Long texts are split into sentences that are cached individually, so an
+    edited paragraph only resynthesizes the changed sentences. The MP3 frames
+    of the sentences are concatenated in order.
+
+    Browsers don't cache POST responses; replays are served from the
+    frontend's audio cache (ttsAudioCache in ui.js).
     """
     try:
         # Use provided voice or default
-        voice = request.voice or DEFAULT_VOICE
+        provider = get_tts_provider()
+        voice = request.voice or provider.default_voice
         rate = request.rate or "+0%"
+        if voice not in _get_valid_voices():
+            raise HTTPException(status_code=400, detail=f"Unknown voice: {voice}")
 
-        logger.info(f"Edge-TTS request: {len(request.text)} chars, voice={voice}, rate={rate}")
+        audio_headers = {"Content-Disposition": "inline; filename=speech.mp3"}
 
-        # Create edge-tts communicate object
-        communicate = edge_tts.Communicate(
-            text=request.text,
-            voice=voice,
-            rate=rate
+        segments = _split_sentences(request.text)
+        logger.info(
+            "TTS request (%s): %d chars in %d segment(s), voice=%s, rate=%s",
+            provider.name, len(request.text), len(segments), voice, rate,
         )
 
-        # Generate speech and collect audio data
-        audio_data = io.BytesIO()
-        async for chunk in communicate.stream():
-            if chunk["type"] == "audio":
-                audio_data.write(chunk["data"])
+        # The first segment is opened eagerly so provider errors return HTTP 500
+        first_audio = await _segment_audio(segments[0], voice, rate)
+        first_hit = isinstance(first_audio, bytes)
 
-        audio_data.seek(0)
+        # Fully cached short text: send the bytes as a plain response
+        if first_hit and len(segments) == 1:
+            return Response(
+                content=first_audio,
+                media_type="audio/mpeg",
+                headers={**audio_headers, "X-Cache": "HIT"}
+            )
 
-        if audio_data.getbuffer().nbytes == 0:
-            raise HTTPException(status_code=500, detail="No audio data generated")
+        async def stream_segments():
+            upcoming = iter(segments[1:])
+            prefetched: Deque[asyncio.Task] = deque()
+
+            def prefetch():
+                # Keep up to PREFETCH_SEGMENTS later segments synthesizing
+                # (each holds a provider slot, so the semaphore still bounds them)
+                while len(prefetched) < PREFETCH_SEGMENTS:
+                    segment = next(upcoming, None)
+                    if segment is None:
+                        break
+                    prefetched.append(asyncio.create_task(_prefetch_segment(segment, voice, rate)))
+
+            try:
+                prefetch()
+                if isinstance(first_audio, bytes):
+                    yield first_audio
+                else:
+                    async for data in first_audio.chunks:
+                        yield data
+                while prefetched:
+                    task = prefetched.popleft()
+                    prefetch()
+                    yield await task
+            finally:
+                # Release the provider slots promptly if the client goes away
+                if not isinstance(first_audio, bytes):
+                    await first_audio.release()
+                for task in prefetched:
+                    task.cancel()
+                await asyncio.gather(*prefetched, return_exceptions=True)
 
         return StreamingResponse(
-            audio_data,
+            stream_segments(),
             media_type="audio/mpeg",
             headers={
-                "Content-Disposition": "inline; filename=speech.mp3"
-            }
+                **audio_headers,
+                # Cache status of the first segment (the latency-relevant one)
+                "X-Cache": "HIT" if first_hit else "MISS",
+            },
+            # Runs after the response even if the body was never iterated
+            background=None if first_hit else BackgroundTask(first_audio.release),
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Edge-TTS error: {e}")
+        logger.error("TTS error: %s", e)
         raise HTTPException(status_code=500, detail=f"Text-to-Speech failed: {str(e)}")
 
 
 @router.get("/voices")
 async def list_voices():
     """
-    List available edge-tts German voices.
-    """
-    return {
-        "voices": [
-            {"id": "de-DE-KatjaNeural", "name": "Katja", "description": "Freundliche weibliche Stimme", "gender": "female"},
-            {"id": "de-DE-AmalaNeural", "name": "Amala", "description": "Warme weibliche Stimme", "gender": "female"},
-            {"id": "de-DE-ConradNeural", "name": "Conrad", "description": "Professionelle männliche Stimme", "gender": "male"},
-            {"id": "de-DE-KillianNeural", "name": "Killian", "description": "Ruhige männliche Stimme", "gender": "male"},
-        ],
-        "default": DEFAULT_VOICE,
-        "provider": "edge-tts (Microsoft Azure)"
-    }
+    List the German voices of the configured provider.
+    """
+    return Response(content=_get_voices_json(), media_type="application/json")
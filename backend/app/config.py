@@ -3,16 +3,27 @@ Application configuration using pydantic-settings.
 Loads values from environment variables / .env file.
 """
 
-from functools import lru_cache
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List, Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Find .env file - check both backend dir and project root
-_backend_dir = Path(__file__).parent.parent
-_project_root = _backend_dir.parent
-_env_file = _project_root / ".env" if (_project_root / ".env").exists() else _backend_dir / ".env"
+
+def _resolve_env_file() -> str:
+    """
+    Find the .env file: ENV_FILE env var, else project root, else backend dir.
+    Resolved on first get_settings() call rather than at import.
+    """
+    env_file = os.environ.get("ENV_FILE")
+    if env_file:
+        return env_file
+    backend_dir = Path(__file__).parent.parent
+    project_root = backend_dir.parent
+    if (project_root / ".env").exists():
+        return str(project_root / ".env")
+    return str(backend_dir / ".env")
 
 
 # Available OpenRouter models (free tier)
@@ -26,15 +37,24 @@ class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     model_config = SettingsConfigDict(
-        env_file=str(_env_file),
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # Settings are immutable per process, so derived values can be cached
+        frozen=True,
     )
 
     # BlueAnt API
     blueant_base_url: str = "https://your-blueant-instance.example.com/api"
     blueant_api_key: str = ""
+    # Max. concurrent per-project requests when loading a portfolio
+    blueant_max_concurrency: int = 10
+    # Seconds masterdata (statuses, priorities, ...) is reused before refetching
+    blueant_masterdata_ttl: float = 300.0
+    # Retries for timeouts, connection errors and 502/503/504 responses (GET only)
+    blueant_max_retries: int = 2
+    # Max. BlueAnt requests in flight at once across the whole service
+    blueant_max_in_flight: int = 50
 
     # LLM Provider Selection
     # Options: "gemini", "openrouter"
@@ -55,6 +75,20 @@ class Settings(BaseSettings):
     # ElevenLabs TTS
     elevenlabs_api_key: str = ""
 
+    # TTS provider (see app.services.tts_provider)
+    tts_provider: Literal["edge-tts"] = "edge-tts"
+
+    # TTS audio cache (finished MP3s, keyed by text/voice/rate)
+    tts_cache_dir: str = "cache/tts"
+    # Disk size limit of the TTS cache; least recently used files are evicted
+    tts_cache_max_bytes: int = 2 * 1024 * 1024 * 1024
+    # Max. concurrent syntheses against the TTS provider (excess requests queue)
+    tts_max_concurrency: int = 8
+
+    # Chart rendering: worker processes for rendering several charts at once
+    # (opt-in; 0 or 1 renders in-process). The pool is started at app startup.
+    chart_render_workers: int = 0
+
     # Application
     app_env: str = "local"
     app_port: int = 8000
@@ -63,18 +97,18 @@ class Settings(BaseSettings):
     # CORS
     cors_origins: List[str] = ["*"]
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         return self.app_env.lower() == "production"
 
-    @property
+    @cached_property
     def active_llm_api_key(self) -> str:
         """Get the API key for the currently configured LLM provider."""
         if self.llm_provider == "openrouter":
             return self.openrouter_api_key
         return self.gemini_api_key
 
-    @property
+    @cached_property
     def active_llm_model(self) -> str:
         """Get the model name for the currently configured LLM provider."""
         if self.llm_provider == "openrouter":
@@ -98,4 +132,4 @@ def get_settings() -> Settings:
     Returns cached settings instance.
     Use dependency injection in FastAPI routes.
     """
-    return Settings()
+    return Settings(_env_file=_resolve_env_file())
@@ -2,13 +2,17 @@
 FastAPI application entry point.
 """
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import analysis, portfolios, reports, tts
 from app.config import get_settings
+from app.services.chart_generator import shutdown_render_pool, start_render_pool
+from app.services.http_client import close_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -17,11 +21,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    # Start chart rendering worker processes if enabled (opt-in)
+    await asyncio.to_thread(start_render_pool)
+    yield
+    # Release pooled outbound connections
+    await close_http_client()
+    # Stop chart rendering worker processes
+    shutdown_render_pool()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="BlueAnt Portfolio Analyzer",
     description="KI-gestützte Portfolioanalyse mit U/I/C/R/DQ-Bewertung",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -4,6 +4,7 @@ These models map directly to the JSON structures returned by BlueAnt REST API.
 """
 
 from datetime import date, datetime
+from functools import cached_property
 from typing import List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -99,14 +100,14 @@ class BlueAntProject(BaseModel):
         None, alias="conclusionMemo", description="Project conclusion/end notes"
     )
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
-    @property
+    @cached_property
     def effective_start_date(self) -> Optional[date]:
         """Get the effective start date from either field."""
         return self.start or self.start_date
 
-    @property
+    @cached_property
     def effective_end_date(self) -> Optional[date]:
         """Get the effective end date from either field."""
         return self.end or self.end_date
@@ -120,6 +121,9 @@ class BlueAntProject(BaseModel):
 class BlueAntPlanningEntry(BaseModel):
     """
     Planning entry representing effort planning, milestones, or forecasts.
+    Entries are immutable after ingestion, so derived values (effort hours,
+    milestone flag) are computed once per entry and can never go stale;
+    the normalizer reads them in several passes.
     """
 
     id: Union[int, str] = Field(..., description="Planning entry ID")
@@ -211,18 +215,18 @@ class BlueAntPlanningEntry(BaseModel):
         None, alias="isMilestone", description="Flag indicating if this is a milestone"
     )
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True, frozen=True)
 
-    @property
+    @cached_property
     def is_likely_milestone(self) -> bool:
         """Determine if this entry is likely a milestone."""
         if self.is_milestone:
             return True
         has_no_work = (self.work_planned_minutes or 0) == 0
         same_start_end = self.start and self.end and self.start == self.end
-        return has_no_work and same_start_end
+        return bool(has_no_work and same_start_end)
 
-    @property
+    @cached_property
     def planned_effort_hours(self) -> float:
         """Get planned effort in hours."""
         if self.work_planned_minutes:
@@ -231,7 +235,7 @@ class BlueAntPlanningEntry(BaseModel):
             return self.planned_effort
         return 0.0
 
-    @property
+    @cached_property
     def actual_effort_hours(self) -> float:
         """Get actual effort in hours."""
         if self.work_actual_minutes:
@@ -255,7 +259,7 @@ class BlueAntPriority(BaseModel):
     sortIdx: Optional[int] = Field(None, description="Sort index")
     color: Optional[str] = Field(None, description="Priority color")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     @property
     def display_name(self) -> str:
@@ -272,7 +276,7 @@ class BlueAntProjectType(BaseModel):
     color: Optional[str] = Field(None, description="Type color")
     active: Optional[bool] = Field(None, description="Is type active")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     @property
     def display_name(self) -> str:
@@ -289,7 +293,7 @@ class BlueAntDepartment(BaseModel):
     parentId: Optional[int] = Field(None, description="Parent department ID")
     active: Optional[bool] = Field(None, description="Is department active")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     @property
     def display_name(self) -> str:
@@ -306,7 +310,7 @@ class BlueAntCustomer(BaseModel):
     active: Optional[bool] = Field(None, description="Is customer active")
     typeId: Optional[int] = Field(None, description="Customer type ID")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     @property
     def display_name(self) -> str:
@@ -328,7 +332,7 @@ class BlueAntStatus(BaseModel):
     phase: Optional[int] = Field(None, description="Phase number")
     active: Optional[bool] = Field(None, description="Is status active")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     @property
     def display_name(self) -> str:
@@ -369,4 +373,4 @@ class BlueAntPortfolio(BaseModel):
         None, alias="createdAt", description="Creation timestamp"
     )
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
@@ -3,10 +3,11 @@ Pydantic models for Word document structure.
 Data-driven approach: models define WHAT to render, not HOW.
 """
 
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Literal, Optional
+from typing import Annotated, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.pptx import RgbColor
 
@@ -46,7 +47,9 @@ class TableCellAlignment(str, Enum):
 
 
 class DocxTextStyle(BaseModel):
-    """Text styling configuration for Word documents."""
+    """Text styling configuration for Word documents (immutable, so instances can be shared)."""
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
 
     font_name: str = "Calibri"
     font_size_pt: int = 11
@@ -56,17 +59,35 @@ class DocxTextStyle(BaseModel):
     color: Optional[RgbColor] = None
     highlight_color: Optional[str] = None  # e.g., "yellow", "green"
 
+    @classmethod
+    def get(cls, **spec) -> "DocxTextStyle":
+        """Shared style for the given field values. Results are cached."""
+        key = tuple(sorted(spec.items()))
+        style = _DOCX_TEXT_STYLES.get(key)
+        if style is None:
+            style = _DOCX_TEXT_STYLES[key] = cls(**spec)
+        return style
+
+
+# DocxTextStyle.get results by field values (builders use a small fixed set of styles)
+_DOCX_TEXT_STYLES: Dict[tuple, DocxTextStyle] = {}
+
 
-class DocxTextRun(BaseModel):
+@dataclass(slots=True)
+class DocxTextRun:
     """A run of text with consistent styling."""
 
-    text: str
-    style: Optional[DocxTextStyle] = None  # None = inherit from paragraph
+    text: Annotated[str, Field(description="Text content of the run")]
+    style: Annotated[
+        Optional[DocxTextStyle], Field(description="Run style (None = inherit from paragraph)")
+    ] = None
 
 
 class DocxParagraph(BaseModel):
     """A paragraph containing one or more text runs."""
 
+    model_config = ConfigDict(defer_build=True)
+
     runs: List[DocxTextRun] = Field(default_factory=list)
     alignment: Literal["left", "center", "right", "justify"] = "left"
     space_before_pt: int = 0
@@ -84,7 +105,7 @@ class DocxParagraph(BaseModel):
         """Create simple single-run paragraph."""
         style = None
         if bold or color:
-            style = DocxTextStyle(bold=bold, color=color)
+            style = DocxTextStyle.get(bold=bold, color=color)
         return cls(runs=[DocxTextRun(text=text, style=style)], alignment=alignment)
 
 
@@ -93,10 +114,11 @@ class DocxParagraph(BaseModel):
 # =============================================================================
 
 
-class DocxTableCell(BaseModel):
+@dataclass(slots=True)
+class DocxTableCell:
     """A single table cell."""
 
-    content: str = ""
+    content: Annotated[str, Field(description="Cell text content")] = ""
     bold: bool = False
     alignment: TableCellAlignment = TableCellAlignment.LEFT
     background_color: Optional[RgbColor] = None
@@ -107,6 +129,8 @@ class DocxTableCell(BaseModel):
 class DocxTableRow(BaseModel):
     """A table row."""
 
+    model_config = ConfigDict(defer_build=True)
+
     cells: List[DocxTableCell] = Field(default_factory=list)
     is_header: bool = False
 
@@ -114,6 +138,8 @@ class DocxTableRow(BaseModel):
 class DocxTable(BaseModel):
     """A table in the document."""
 
+    model_config = ConfigDict(defer_build=True)
+
     rows: List[DocxTableRow] = Field(default_factory=list)
     col_widths_cm: Optional[List[float]] = None  # Column widths in cm
     style_name: str = "Table Grid"  # Word table style
@@ -124,17 +150,20 @@ class DocxTable(BaseModel):
 # =============================================================================
 
 
-class DocxListItem(BaseModel):
+@dataclass(slots=True)
+class DocxListItem:
     """A single list item."""
 
-    text: str
+    text: Annotated[str, Field(description="List item text")]
     bold: bool = False
-    level: int = 0  # Nesting level (0 = top level)
+    level: Annotated[int, Field(description="Nesting level (0 = top level)")] = 0
 
 
 class DocxList(BaseModel):
     """A list (bulleted or numbered)."""
 
+    model_config = ConfigDict(defer_build=True)
+
     items: List[DocxListItem] = Field(default_factory=list)
     style: ListStyle = ListStyle.BULLET
 
@@ -147,6 +176,8 @@ class DocxList(BaseModel):
 class DocxHeading(BaseModel):
     """A heading in the document."""
 
+    model_config = ConfigDict(defer_build=True)
+
     text: str
     level: HeadingLevel = HeadingLevel.H1
     color: Optional[RgbColor] = None
@@ -154,6 +185,8 @@ class DocxHeading(BaseModel):
 
 class DocxImage(BaseModel):
     """An image in the document."""
+
+    model_config = ConfigDict(defer_build=True)
     
     image_bytes: bytes = Field(..., description="PNG/JPEG image as bytes")
     width_cm: Optional[float] = None  # Width in cm, None = auto
@@ -162,9 +195,15 @@ class DocxImage(BaseModel):
     alignment: Literal["left", "center", "right"] = "center"
 
 
+# Kind of a content_order entry; the int next to it indexes the matching list
+ContentKind = Literal["paragraph", "table", "list", "image"]
+
+
 class DocxSection(BaseModel):
     """A logical section of the document."""
 
+    model_config = ConfigDict(defer_build=True)
+
     heading: Optional[DocxHeading] = None
     paragraphs: List[DocxParagraph] = Field(default_factory=list)
     tables: List[DocxTable] = Field(default_factory=list)
@@ -173,7 +212,7 @@ class DocxSection(BaseModel):
 
     # Content order tracking (for mixed content)
     # Format: [("paragraph", 0), ("table", 0), ("paragraph", 1), ("image", 0), ...]
-    content_order: List[tuple] = Field(default_factory=list)
+    content_order: List[Tuple[ContentKind, int]] = Field(default_factory=list)
 
 
 # =============================================================================
@@ -184,35 +223,24 @@ class DocxSection(BaseModel):
 class DocxDocumentModel(BaseModel):
     """Complete Word document model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     title: str = Field(..., description="Document title (for metadata)")
     author: str = Field(default="BlueAnt AI Analysis", description="Document author")
 
     # Document sections
     sections: List[DocxSection] = Field(default_factory=list)
 
-    # Theme/branding (for consistent styling)
-    primary_color: RgbColor = Field(
-        default_factory=lambda: RgbColor(r=1, g=107, b=213)  # BlueAnt blue
-    )
-    accent_color: RgbColor = Field(
-        default_factory=lambda: RgbColor(r=0, g=141, b=202)  # Light blue
-    )
-    text_color: RgbColor = Field(
-        default_factory=lambda: RgbColor(r=51, g=51, b=51)  # Dark gray
-    )
+    # Theme/branding (for consistent styling); RgbColor is immutable, so the
+    # defaults are shared instances rather than built per document
+    primary_color: RgbColor = RgbColor.from_hex("#016BD5")  # BlueAnt blue
+    accent_color: RgbColor = RgbColor.from_hex("#008DCA")  # Light blue
+    text_color: RgbColor = RgbColor.from_hex("#333333")  # Dark gray
 
     # Status colors for traffic lights
-    status_green: RgbColor = Field(
-        default_factory=lambda: RgbColor(r=0, g=170, b=68)  # #00AA44
-    )
-    status_yellow: RgbColor = Field(
-        default_factory=lambda: RgbColor(r=255, g=170, b=0)  # #FFAA00
-    )
-    status_red: RgbColor = Field(
-        default_factory=lambda: RgbColor(r=204, g=0, b=0)  # #CC0000
-    )
-    status_gray: RgbColor = Field(
-        default_factory=lambda: RgbColor(r=128, g=128, b=128)  # #808080
-    )
+    status_green: RgbColor = RgbColor.from_hex("#00AA44")
+    status_yellow: RgbColor = RgbColor.from_hex("#FFAA00")
+    status_red: RgbColor = RgbColor.from_hex("#CC0000")
+    status_gray: RgbColor = RgbColor.from_hex("#808080")
 
 
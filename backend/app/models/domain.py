@@ -3,11 +3,12 @@ Normalized data models for internal use.
 These models represent cleaned, structured project data ready for LLM analysis.
 """
 
+from dataclasses import dataclass
 from datetime import date, datetime
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Annotated, List, Optional, TypedDict, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class StatusColor(str, Enum):
@@ -29,27 +30,30 @@ class MilestoneStatus(str, Enum):
     NOT_STARTED = "not_started"
 
 
-class NormalizedMilestone(BaseModel):
+@dataclass(slots=True)
+class NormalizedMilestone:
     """Normalized milestone with clear status indication."""
 
-    name: str = Field(..., description="Milestone name")
-    planned_date: Optional[date] = Field(None, description="Originally planned date")
-    actual_date: Optional[date] = Field(
-        None, description="Actual completion date (if completed)"
-    )
-    forecast_date: Optional[date] = Field(None, description="Current forecast date")
-    status: MilestoneStatus = Field(
-        default=MilestoneStatus.NOT_STARTED, description="Current milestone status"
-    )
-    delay_days: int = Field(
-        default=0, description="Delay in days (positive = late, negative = early)"
-    )
-    description: Optional[str] = Field(None, description="Milestone description")
+    name: Annotated[str, Field(description="Milestone name")]
+    planned_date: Annotated[Optional[date], Field(description="Originally planned date")] = None
+    actual_date: Annotated[
+        Optional[date], Field(description="Actual completion date (if completed)")
+    ] = None
+    forecast_date: Annotated[Optional[date], Field(description="Current forecast date")] = None
+    status: Annotated[
+        MilestoneStatus, Field(description="Current milestone status")
+    ] = MilestoneStatus.NOT_STARTED
+    delay_days: Annotated[
+        int, Field(description="Delay in days (positive = late, negative = early)")
+    ] = 0
+    description: Annotated[Optional[str], Field(description="Milestone description")] = None
 
 
 class NormalizedProject(BaseModel):
     """Normalized project data structure ready for LLM analysis."""
 
+    model_config = ConfigDict(defer_build=True)
+
     # Identifiers
     id: str = Field(..., description="Unique project identifier")
     name: str = Field(..., description="Project name")
@@ -156,10 +160,27 @@ class NormalizedProject(BaseModel):
         None, description="Last data update timestamp"
     )
 
+    def as_dict(self) -> "NormalizedProjectDict":
+        """
+        Shallow field dict for read-only consumers (e.g. prompt formatting).
+        Unlike model_dump() it does not serialize nested values, so enums,
+        dates and milestones are passed through as-is.
+        """
+        return dict(self.__dict__)
+
+
+# Typed view of NormalizedProject.as_dict(), one key per model field
+NormalizedProjectDict = TypedDict(
+    "NormalizedProjectDict",
+    {name: field.annotation for name, field in NormalizedProject.model_fields.items()},
+)
+
 
 class ProjectsPerStatus(BaseModel):
     """Aggregation of project counts per status."""
 
+    model_config = ConfigDict(defer_build=True)
+
     status_label: str
     status_color: StatusColor
     count: int
@@ -168,6 +189,8 @@ class ProjectsPerStatus(BaseModel):
 class NormalizedPortfolio(BaseModel):
     """Normalized portfolio with all projects and aggregated metrics."""
 
+    model_config = ConfigDict(defer_build=True)
+
     # Identifiers
     id: Union[str, int] = Field(..., description="Portfolio identifier")
     name: str = Field(..., description="Portfolio name")
@@ -206,6 +229,6 @@ class NormalizedPortfolio(BaseModel):
 
     # Metadata
     analysis_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(),
+        default_factory=datetime.now,
         description="Timestamp when this data was compiled",
     )
@@ -1,12 +1,20 @@
 """
 Pydantic models for PowerPoint presentation structure.
 Data-driven approach: models define WHAT to render, not HOW.
+
+High-volume leaf types (Position, TextRun, ChartDataPoint, ChartDataSeries,
+TableCell) are slotted stdlib dataclasses. Pydantic validates them when
+they arrive as dicts or JSON, but instances built in code are passed
+through unchecked. ChartShape therefore checks the chart data it hands to
+matplotlib.
 """
 
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Literal, Optional, Union
+from numbers import Real
+from typing import Annotated, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 # =============================================================================
@@ -15,7 +23,9 @@ from pydantic import BaseModel, Field
 
 
 class RgbColor(BaseModel):
-    """RGB color specification."""
+    """RGB color specification (immutable, so instances can be shared)."""
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
 
     r: int = Field(..., ge=0, le=255)
     g: int = Field(..., ge=0, le=255)
@@ -23,17 +33,30 @@ class RgbColor(BaseModel):
 
     @classmethod
     def from_hex(cls, hex_color: str) -> "RgbColor":
-        """Create from hex string like '#016bd5' or '016bd5'."""
-        hex_color = hex_color.lstrip("#")
-        return cls(
-            r=int(hex_color[0:2], 16),
-            g=int(hex_color[2:4], 16),
-            b=int(hex_color[4:6], 16),
-        )
+        """
+        Create from hex string like '#016bd5' or '016BD5'. Results are cached,
+        so spellings of the same color share one instance.
+        """
+        color = _HEX_COLORS.get(hex_color)
+        if color is None:
+            digits = hex_color.lstrip("#").lower()
+            color = _HEX_COLORS.get(digits)
+            if color is None:
+                r, g, b = bytes.fromhex(digits)
+                color = _HEX_COLORS[digits] = cls(r=r, g=g, b=b)
+            _HEX_COLORS[hex_color] = color
+        return color
+
+
+# RgbColor.from_hex results by input string and by its canonical lowercase
+# digits (palettes are small and fixed)
+_HEX_COLORS: Dict[str, RgbColor] = {}
 
 
 class TextStyle(BaseModel):
-    """Text styling configuration."""
+    """Text styling configuration (immutable, so instances can be shared)."""
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
 
     font_name: str = "Calibri"
     font_size_pt: int = 12
@@ -41,14 +64,28 @@ class TextStyle(BaseModel):
     italic: bool = False
     color: Optional[RgbColor] = None
 
+    @classmethod
+    def get(cls, **spec) -> "TextStyle":
+        """Shared style for the given field values. Results are cached."""
+        key = tuple(sorted(spec.items()))
+        style = _TEXT_STYLES.get(key)
+        if style is None:
+            style = _TEXT_STYLES[key] = cls(**spec)
+        return style
+
+
+# TextStyle.get results by field values (builders use a small fixed set of styles)
+_TEXT_STYLES: Dict[tuple, TextStyle] = {}
+
 
-class Position(BaseModel):
+@dataclass(slots=True)
+class Position:
     """Position and size in inches."""
 
-    x: float = Field(..., description="X position in inches")
-    y: float = Field(..., description="Y position in inches")
-    width: float = Field(..., description="Width in inches")
-    height: float = Field(..., description="Height in inches")
+    x: Annotated[float, Field(description="X position in inches")]
+    y: Annotated[float, Field(description="Y position in inches")]
+    width: Annotated[float, Field(description="Width in inches")]
+    height: Annotated[float, Field(description="Height in inches")]
 
 
 # =============================================================================
@@ -56,16 +93,21 @@ class Position(BaseModel):
 # =============================================================================
 
 
-class TextRun(BaseModel):
+@dataclass(slots=True)
+class TextRun:
     """A run of text with consistent styling."""
 
-    text: str
-    style: Optional[TextStyle] = None  # None = inherit from paragraph
+    text: Annotated[str, Field(description="Text content of the run")]
+    style: Annotated[
+        Optional[TextStyle], Field(description="Run style (None = inherit from paragraph)")
+    ] = None
 
 
 class TextParagraph(BaseModel):
     """A paragraph containing one or more text runs."""
 
+    model_config = ConfigDict(defer_build=True)
+
     runs: List[TextRun] = Field(default_factory=list)
     alignment: Literal["left", "center", "right"] = "left"
     space_after_pt: int = 0
@@ -84,6 +126,8 @@ class TextParagraph(BaseModel):
 class TextBoxShape(BaseModel):
     """A text box shape."""
 
+    model_config = ConfigDict(defer_build=True)
+
     shape_type: Literal["textbox"] = "textbox"
     position: Position
     paragraphs: List[TextParagraph] = Field(default_factory=list)
@@ -93,6 +137,8 @@ class TextBoxShape(BaseModel):
 class ImageShape(BaseModel):
     """An image shape."""
 
+    model_config = ConfigDict(defer_build=True)
+
     shape_type: Literal["image"] = "image"
     position: Position
     image_path: Optional[str] = None
@@ -102,6 +148,8 @@ class ImageShape(BaseModel):
 class RectangleShape(BaseModel):
     """A rectangle shape for decorative elements."""
 
+    model_config = ConfigDict(defer_build=True)
+
     shape_type: Literal["rectangle"] = "rectangle"
     position: Position
     fill_color: Optional[RgbColor] = None
@@ -127,25 +175,29 @@ class ChartType(str, Enum):
     STACKED_BAR = "stacked_bar"  # Stacked bar chart
 
 
-class ChartDataPoint(BaseModel):
+@dataclass(slots=True)
+class ChartDataPoint:
     """A single data point for charts."""
 
-    label: str = Field(..., description="Label for this data point")
-    value: float = Field(..., description="Numeric value")
+    label: Annotated[str, Field(description="Label for this data point")]
+    value: Annotated[float, Field(description="Numeric value")]
     color: Optional[RgbColor] = None  # Optional custom color for this point
 
 
-class ChartDataSeries(BaseModel):
+@dataclass(slots=True)
+class ChartDataSeries:
     """A data series for multi-series charts."""
 
-    name: str = Field(..., description="Series name for legend")
-    values: List[float] = Field(default_factory=list, description="Numeric values")
+    name: Annotated[str, Field(description="Series name for legend")]
+    values: Annotated[List[float], Field(description="Numeric values")] = field(default_factory=list)
     color: Optional[RgbColor] = None  # Optional custom color for this series
 
 
 class ChartShape(BaseModel):
     """A chart shape for data visualization."""
 
+    model_config = ConfigDict(defer_build=True)
+
     shape_type: Literal["chart"] = "chart"
     position: Optional[Position] = None  # Can be set later by builder
     chart_type: ChartType = Field(..., description="Type of chart to render")
@@ -181,11 +233,30 @@ class ChartShape(BaseModel):
     # Pre-rendered chart (generated by chart_generator)
     rendered_image_bytes: Optional[bytes] = None
 
+    @field_validator("data_points")
+    @classmethod
+    def check_data_points(cls, data_points: List[ChartDataPoint]) -> List[ChartDataPoint]:
+        """Reject unvalidated data points with non-numeric values."""
+        for point in data_points:
+            if not isinstance(point.label, str) or not isinstance(point.value, Real):
+                raise ValueError(f"Invalid chart data point: {point!r}")
+        return data_points
+
+    @field_validator("series")
+    @classmethod
+    def check_series(cls, series: List[ChartDataSeries]) -> List[ChartDataSeries]:
+        """Reject unvalidated series with non-numeric values."""
+        for entry in series:
+            if not isinstance(entry.name, str) or not all(isinstance(v, Real) for v in entry.values):
+                raise ValueError(f"Invalid chart data series: {entry!r}")
+        return series
+
 
-class TableCell(BaseModel):
+@dataclass(slots=True)
+class TableCell:
     """A single cell in a table."""
 
-    text: str = Field(..., description="Cell text content")
+    text: Annotated[str, Field(description="Cell text content")]
     style: Optional[TextStyle] = None
     background_color: Optional[RgbColor] = None
     colspan: int = 1
@@ -195,6 +266,8 @@ class TableCell(BaseModel):
 class TableRow(BaseModel):
     """A row in a table."""
 
+    model_config = ConfigDict(defer_build=True)
+
     cells: List[TableCell] = Field(default_factory=list)
     is_header: bool = False
 
@@ -202,6 +275,8 @@ class TableRow(BaseModel):
 class TableShape(BaseModel):
     """A table shape for structured data display."""
 
+    model_config = ConfigDict(defer_build=True)
+
     shape_type: Literal["table"] = "table"
     position: Position
     rows: List[TableRow] = Field(default_factory=list)
@@ -211,8 +286,12 @@ class TableShape(BaseModel):
     alternating_row_color: Optional[RgbColor] = None
 
 
-# Union type for all shapes
-ShapeModel = Union[TextBoxShape, ImageShape, RectangleShape, ChartShape, TableShape]
+# Union type for all shapes, tagged by shape_type so validation picks the
+# variant directly instead of trying each one in turn
+ShapeModel = Annotated[
+    Union[TextBoxShape, ImageShape, RectangleShape, ChartShape, TableShape],
+    Field(discriminator="shape_type"),
+]
 
 
 # =============================================================================
@@ -259,6 +338,8 @@ class VisualizationType(str, Enum):
 class SlideVisualization(BaseModel):
     """A visualization element recommended by AI for a slide."""
 
+    model_config = ConfigDict(defer_build=True)
+
     visualization_type: VisualizationType
     data_source: str = Field(..., description="What data to visualize (e.g., 'avg_scores', 'critical_projects')")
     description: str = Field(..., description="Description of what this visualization shows")
@@ -268,6 +349,8 @@ class SlideVisualization(BaseModel):
 class AISlideSpec(BaseModel):
     """AI-generated specification for a single slide."""
 
+    model_config = ConfigDict(defer_build=True)
+
     slide_type: SlideType
     title: str
     subtitle: Optional[str] = None
@@ -279,6 +362,8 @@ class AISlideSpec(BaseModel):
 class AIPresentationStructure(BaseModel):
     """AI-generated presentation structure."""
 
+    model_config = ConfigDict(defer_build=True)
+
     slides: List[AISlideSpec] = Field(default_factory=list)
     theme_suggestion: Optional[str] = None
     total_estimated_slides: int = 0
@@ -287,6 +372,8 @@ class AIPresentationStructure(BaseModel):
 class PptxSlideModel(BaseModel):
     """A single slide in the presentation."""
 
+    model_config = ConfigDict(defer_build=True)
+
     layout: SlideLayout = SlideLayout.BLANK
     shapes: List[ShapeModel] = Field(default_factory=list)
     notes: Optional[str] = None  # Speaker notes
@@ -300,6 +387,8 @@ class PptxSlideModel(BaseModel):
 class PptxPresentationModel(BaseModel):
     """Complete presentation model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     title: str = Field(..., description="Presentation title (for metadata)")
     slides: List[PptxSlideModel] = Field(default_factory=list)
 
@@ -307,13 +396,8 @@ class PptxPresentationModel(BaseModel):
     width_inches: float = 13.333
     height_inches: float = 7.5
 
-    # Theme/branding (for consistent styling)
-    primary_color: RgbColor = Field(
-        default_factory=lambda: RgbColor(r=1, g=107, b=213)
-    )
-    accent_color: RgbColor = Field(
-        default_factory=lambda: RgbColor(r=0, g=141, b=202)
-    )
-    text_color: RgbColor = Field(
-        default_factory=lambda: RgbColor(r=51, g=51, b=51)
-    )
+    # Theme/branding (for consistent styling); RgbColor is immutable, so the
+    # defaults are shared instances rather than built per presentation
+    primary_color: RgbColor = RgbColor.from_hex("#016BD5")
+    accent_color: RgbColor = RgbColor.from_hex("#008DCA")
+    text_color: RgbColor = RgbColor.from_hex("#333333")
@@ -2,17 +2,24 @@
 Pydantic models for U/I/C/R/DQ scoring results.
 """
 
-from typing import List, Optional
+from functools import cached_property
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ScoreValue(BaseModel):
     """
     Single dimension score with value and reasoning.
     Scale: 1-5 (1=sehr niedrig, 2=niedrig, 3=mittel, 4=hoch, 5=sehr hoch)
+
+    Immutable: ProjectScore caches scores derived from these values, so a
+    changed score is assigned as a new ScoreValue.
     """
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     value: int = Field(..., ge=1, le=5, description="Score from 1 to 5")
     reasoning: str = Field(..., description="Brief explanation for this score")
 
@@ -25,6 +32,10 @@ class ScoreValue(BaseModel):
         return v
 
 
+# ProjectScore fields the derived scores are computed from
+_SCORE_DIMENSIONS = frozenset({"urgency", "importance", "complexity", "risk", "data_quality"})
+
+
 class ProjectScore(BaseModel):
     """
     Complete U/I/C/R/DQ scoring for a single project.
@@ -37,6 +48,8 @@ class ProjectScore(BaseModel):
     - DQ (Data Quality/Datenqualität): Vollständigkeit und Klarheit der Daten
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     project_id: str = Field(..., description="Project identifier")
     project_name: str = Field(..., description="Project name for reference")
 
@@ -93,20 +106,36 @@ class ProjectScore(BaseModel):
         default_factory=list, description="Reasons for status mismatch"
     )
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # SanityValidator replaces dimension scores after scoring; drop the
+        # cached derived scores so they are recomputed on next access
+        if name in _SCORE_DIMENSIONS:
+            self._clear_derived_scores()
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "ProjectScore":
+        # update= writes the copy's fields directly, bypassing __setattr__
+        copy = super().model_copy(update=update, deep=deep)
+        copy._clear_derived_scores()
+        return copy
+
+    def _clear_derived_scores(self) -> None:
+        self.__dict__.pop("average_score", None)
+        self.__dict__.pop("priority_score", None)
+
+    @cached_property
     def average_score(self) -> float:
-        """Calculate average of all dimension scores."""
-        scores = [
-            self.urgency.value,
-            self.importance.value,
-            self.complexity.value,
-            self.risk.value,
-        ]
-        return sum(scores) / len(scores)
-
-    @property
+        """Calculate average of the U/I/C/R dimension scores."""
+        return (
+            self.urgency.value
+            + self.importance.value
+            + self.complexity.value
+            + self.risk.value
+        ) / 4
+
+    @cached_property
     def priority_score(self) -> float:
-        """Calculate priority score for ranking."""
+        """Calculate priority score for ranking (cached until a dimension score changes)."""
         base = (self.urgency.value * 2 + self.importance.value * 2) / 4
         risk_factor = self.risk.value / 5
         confidence = self.data_quality.value / 5
@@ -116,6 +145,8 @@ class ProjectScore(BaseModel):
 class PortfolioAnalysis(BaseModel):
     """Aggregated portfolio analysis result from LLM."""
 
+    model_config = ConfigDict(defer_build=True)
+
     portfolio_id: str = Field(..., description="Portfolio identifier")
     portfolio_name: str = Field(..., description="Portfolio name")
 
@@ -166,23 +197,32 @@ class PortfolioAnalysis(BaseModel):
 
     def compute_statistics(self) -> None:
         """Compute average statistics from project scores."""
-        if not self.project_scores:
+        scores = self.project_scores
+        if not scores:
             return
 
-        n = len(self.project_scores)
-        self.avg_urgency = sum(p.urgency.value for p in self.project_scores) / n
-        self.avg_importance = sum(p.importance.value for p in self.project_scores) / n
-        self.avg_complexity = sum(p.complexity.value for p in self.project_scores) / n
-        self.avg_risk = sum(p.risk.value for p in self.project_scores) / n
-        self.avg_data_quality = sum(p.data_quality.value for p in self.project_scores) / n
+        # One pass over the scores for all five dimension sums
+        urgency = importance = complexity = risk = data_quality = 0
+        critical_projects = []
+        for p in scores:
+            urgency += p.urgency.value
+            importance += p.importance.value
+            complexity += p.complexity.value
+            risk += p.risk.value
+            data_quality += p.data_quality.value
+            if p.is_critical:
+                critical_projects.append(p.project_id)
+
+        n = len(scores)
+        self.avg_urgency = urgency / n
+        self.avg_importance = importance / n
+        self.avg_complexity = complexity / n
+        self.avg_risk = risk / n
+        self.avg_data_quality = data_quality / n
 
         # Update critical projects list
-        self.critical_projects = [
-            p.project_id for p in self.project_scores if p.is_critical
-        ]
+        self.critical_projects = critical_projects
 
         # Update priority ranking
-        sorted_projects = sorted(
-            self.project_scores, key=lambda p: p.priority_score, reverse=True
-        )
+        sorted_projects = sorted(scores, key=attrgetter("priority_score"), reverse=True)
         self.priority_ranking = [p.project_id for p in sorted_projects]
@@ -7,13 +7,16 @@ Supports multiple LLM providers:
 - OpenRouter (Mistral, Google)
 """
 
+import asyncio
 import logging
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from app.ai.gemini import GeminiService
 from app.ai.openrouter import OpenRouterService
 from app.ai.llm_factory import get_llm_service, LLMProvider
-from app.models.domain import NormalizedPortfolio
+from app.config import get_settings
+from app.models.blueant import BlueAntProject
+from app.models.domain import NormalizedPortfolio, NormalizedProject
 from app.models.scoring import PortfolioAnalysis
 from app.services.blueant import BlueAntService
 from app.services.normalizer import DataNormalizer
@@ -61,6 +64,28 @@ class PortfolioAnalyzer:
         provider_name = type(self.llm_service).__name__
         logger.info(f"PortfolioAnalyzer initialized with LLM service: {provider_name}")
 
+    async def _normalize_projects(
+        self, raw_projects: List[BlueAntProject]
+    ) -> List[NormalizedProject]:
+        """
+        Fetch planning entries for all projects concurrently and normalize them.
+        At most settings.blueant_max_concurrency requests run at once; projects
+        that fail to load or normalize are skipped. Input order is kept.
+        """
+        semaphore = asyncio.Semaphore(get_settings().blueant_max_concurrency)
+
+        async def normalize(project: BlueAntProject) -> Optional[NormalizedProject]:
+            try:
+                async with semaphore:
+                    planning_entries = await self.blueant.get_project_planning_entries(project.id)
+                return self.normalizer.normalize_project(project, planning_entries)
+            except Exception as e:
+                logger.warning(f"Failed to normalize project {project.id}: {e}")
+                return None
+
+        results = await asyncio.gather(*(normalize(project) for project in raw_projects))
+        return [normalized for normalized in results if normalized is not None]
+
     async def analyze_portfolio(
         self,
         portfolio_id: str,
@@ -77,8 +102,6 @@ class PortfolioAnalyzer:
         logger.info(f"Starting analysis for portfolio: {portfolio_id}")
 
         # Step 1: Fetch data from BlueAnt (parallel fetch for performance)
-        import asyncio
-        
         portfolio_task = self.blueant.get_portfolio(portfolio_id)
         projects_task = self.blueant.get_portfolio_projects(portfolio_id)
         masterdata_task = self.blueant.get_all_masterdata()
@@ -97,14 +120,7 @@ class PortfolioAnalyzer:
         # Step 2: Normalize data with all masterdata
         self.normalizer.set_all_masterdata(masterdata)
 
-        normalized_projects = []
-        for project in raw_projects:
-            try:
-                planning_entries = await self.blueant.get_project_planning_entries(project.id)
-                normalized = self.normalizer.normalize_project(project, planning_entries)
-                normalized_projects.append(normalized)
-            except Exception as e:
-                logger.warning(f"Failed to normalize project {project.id}: {e}")
+        normalized_projects = await self._normalize_projects(raw_projects)
 
         normalized_portfolio = self.normalizer.normalize_portfolio(
             portfolio, normalized_projects
@@ -129,8 +145,6 @@ class PortfolioAnalyzer:
         Get normalized portfolio data without AI analysis.
         Useful for previewing data before running full analysis.
         """
-        import asyncio
-        
         portfolio_task = self.blueant.get_portfolio(portfolio_id)
         projects_task = self.blueant.get_portfolio_projects(portfolio_id)
         masterdata_task = self.blueant.get_all_masterdata()
@@ -141,13 +155,6 @@ class PortfolioAnalyzer:
 
         self.normalizer.set_all_masterdata(masterdata)
 
-        normalized_projects = []
-        for project in raw_projects:
-            try:
-                planning_entries = await self.blueant.get_project_planning_entries(project.id)
-                normalized = self.normalizer.normalize_project(project, planning_entries)
-                normalized_projects.append(normalized)
-            except Exception as e:
-                logger.warning(f"Failed to normalize project {project.id}: {e}")
+        normalized_projects = await self._normalize_projects(raw_projects)
 
         return self.normalizer.normalize_portfolio(portfolio, normalized_projects)
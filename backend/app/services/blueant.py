@@ -3,10 +3,16 @@ BlueAnt REST API Client.
 Wraps all API calls to BlueAnt for fetching project portfolio data.
 """
 
+import asyncio
 import logging
-from typing import List, Optional, Union
+import random
+import time
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Type, TypeVar, Union
 
 import httpx
+from pydantic import BaseModel, TypeAdapter, create_model
 
 from app.config import get_settings
 from app.models.blueant import (
@@ -19,9 +25,136 @@ from app.models.blueant import (
     BlueAntProjectType,
     BlueAntStatus,
 )
+from app.services.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+# =============================================================================
+# Payload parsers
+# =============================================================================
+# BlueAnt returns lists either as a bare JSON array or wrapped in an object
+# ("items", "projects", ...), and single entities either bare or wrapped.
+# The parsers below validate the raw response bytes in one pydantic-core pass,
+# without building intermediate Python dicts first.
+
+
+class _ListParser:
+    """Parses a list payload: bare array or object wrapping it under one of keys."""
+
+    def __init__(self, model: Type[ModelT], keys: Sequence[str]):
+        self.model = model
+        self.keys = tuple(keys)
+
+    @cached_property
+    def adapter(self) -> TypeAdapter:
+        # Built on first use, so endpoints never called cost nothing at import
+        envelope = create_model(
+            f"{self.model.__name__}ListEnvelope",
+            **{key: (Optional[List[self.model]], None) for key in self.keys},
+        )
+        return TypeAdapter(Union[List[self.model], envelope])
+
+    def parse(self, raw: bytes) -> List[ModelT]:
+        data = self.adapter.validate_json(raw)
+        if isinstance(data, list):
+            return data
+        for key in self.keys:
+            items = getattr(data, key)
+            if items is not None:
+                return items
+        return []
+
+
+class _EntityParser:
+    """Parses a single entity: bare object or wrapped as {key: {...}}."""
+
+    def __init__(self, model: Type[ModelT], key: str):
+        self.model = model
+        self.key = key
+
+    @cached_property
+    def adapter(self) -> TypeAdapter:
+        envelope = create_model(f"{self.model.__name__}Envelope", **{self.key: (self.model, ...)})
+        return TypeAdapter(Union[envelope, self.model])
+
+    def parse(self, raw: bytes) -> ModelT:
+        data = self.adapter.validate_json(raw)
+        if isinstance(data, self.model):
+            return data
+        return getattr(data, self.key)
+
+
+_PORTFOLIO = _EntityParser(BlueAntPortfolio, "portfolio")
+_PORTFOLIOS = _ListParser(BlueAntPortfolio, ("portfolios", "items"))
+_PROJECT = _EntityParser(BlueAntProject, "project")
+_PROJECTS = _ListParser(BlueAntProject, ("projects", "items"))
+_PORTFOLIO_PROJECTS = _ListParser(BlueAntProject, ("items", "projects"))
+_PLANNING_ENTRIES = _ListParser(BlueAntPlanningEntry, ("entries", "items"))
+_STATUSES = _ListParser(BlueAntStatus, ("items",))
+_PRIORITIES = _ListParser(BlueAntPriority, ("items",))
+_PROJECT_TYPES = _ListParser(BlueAntProjectType, ("items",))
+_DEPARTMENTS = _ListParser(BlueAntDepartment, ("items", "departments"))
+_CUSTOMERS = _ListParser(BlueAntCustomer, ("items", "customers"))
+
+
+# Retry policy for transient failures (timeouts, connection errors, gateway errors)
+_RETRY_STATUS_CODES = frozenset({502, 503, 504})
+# Only idempotent requests are retried; a repeated write could apply twice
+_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_RETRY_BASE_DELAY = 0.05
+_RETRY_MAX_DELAY = 2.0
+# Statuses that may succeed later; any other error status is treated as permanent
+_TRANSIENT_STATUS_CODES = _RETRY_STATUS_CODES | {408, 429}
+
+# Seconds a portfolio lookup may take before the portfolioId fallback is
+# started alongside it
+_FALLBACK_HEDGE_DELAY = 1.0
+
+# Project IDs per bulk request (keeps the query string well below URL limits)
+_BATCH_IDS_CHUNK = 50
+
+
+class _CachedList(NamedTuple):
+    """A cached list response: parsed items, expiry (monotonic) and ETag."""
+
+    expires: float
+    items: tuple
+    etag: Optional[str]
+
+
+@dataclass(slots=True)
+class _SharedRequest:
+    """An in-flight GET shared by concurrent identical calls."""
+
+    task: asyncio.Future  # Resolves to the response body
+    waiters: int = 0  # Callers currently awaiting task
+
+
+@dataclass(slots=True, eq=False)
+class _LoopState:
+    """asyncio primitives of a BlueAntService, bound to one event loop."""
+
+    loop: asyncio.AbstractEventLoop
+    in_flight: asyncio.Semaphore  # Upper bound on requests in flight across all callers
+    # Refresh locks of cached list endpoints
+    list_cache_locks: Dict[str, asyncio.Lock] = field(default_factory=dict)
+    # Running GET requests by (endpoint, params), shared by concurrent callers
+    in_flight_gets: Dict[tuple, _SharedRequest] = field(default_factory=dict)
+
+
+def _forget_in_flight(
+    in_flight_gets: Dict[tuple, _SharedRequest], key: tuple, task: asyncio.Future
+) -> None:
+    if key in in_flight_gets and in_flight_gets[key].task is task:
+        del in_flight_gets[key]
+    # Errors reach every caller still waiting (and are logged by _send);
+    # mark them retrieved in case all callers were cancelled meanwhile
+    if not task.cancelled():
+        task.exception()
+
 
 class BlueAntClientError(Exception):
     """Exception raised for BlueAnt API errors."""
@@ -52,55 +185,169 @@ class BlueAntService:
         self.base_url = (base_url or settings.blueant_base_url).rstrip("/")
         self.api_key = api_key or settings.blueant_api_key
         self.timeout = timeout
-
-        if not self.api_key:
-            logger.warning("BlueAnt API key not configured!")
-
-    def _get_headers(self) -> dict[str, str]:
-        """Build request headers with authentication."""
-        return {
+        # Whether /v1/projects honours the ids filter (None = not probed yet)
+        self._batch_ids_supported: Optional[bool] = None
+        # Cached list responses (masterdata, portfolios) by endpoint
+        self._list_cache: Dict[str, _CachedList] = {}
+        # asyncio primitives of the event loop currently using the service
+        self._max_in_flight = settings.blueant_max_in_flight
+        self._loop_state_cache: Optional[_LoopState] = None
+
+        # Request headers with authentication (built once, never mutated)
+        self._headers: dict[str, str] = {
             "Authorization": f"Bearer {self.api_key}",
             "BA-Authorization": self.api_key,
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
 
-    async def _request(
+        if not self.api_key:
+            logger.warning("BlueAnt API key not configured!")
+
+    def _loop_state(self) -> _LoopState:
+        """
+        Semaphore, locks and shared requests for the running event loop.
+        The service is a process-wide singleton, but asyncio primitives bind
+        to the loop that first uses them, so a new loop (tests, workers
+        running their own loop) gets a fresh set.
+        """
+        loop = asyncio.get_running_loop()
+        state = self._loop_state_cache
+        if state is None or state.loop is not loop:
+            state = self._loop_state_cache = _LoopState(loop, asyncio.Semaphore(self._max_in_flight))
+        return state
+
+    async def _send(
         self,
         method: str,
         endpoint: str,
         params: Optional[dict] = None,
         json_data: Optional[dict] = None,
-    ) -> Union[dict, list]:
-        """Execute HTTP request to BlueAnt API."""
+        headers: Optional[dict] = None,
+    ) -> httpx.Response:
+        """Execute HTTP request to BlueAnt API; error statuses raise BlueAntClientError."""
         url = f"{self.base_url}{endpoint}"
         logger.debug(f"BlueAnt API request: {method} {url}")
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self._get_headers(),
-                    params=params,
-                    json=json_data,
-                )
+        request_headers = {**self._headers, **headers} if headers else self._headers
+
+        attempts = get_settings().blueant_max_retries + 1 if method in _RETRY_METHODS else 1
+        for attempt in range(attempts):
+            if attempt > 0:
+                # Exponential backoff with full jitter: 0.1s, 0.2s, ... capped at 2s
+                delay = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt))
+                logger.info(f"Retry attempt {attempt + 1}/{attempts} for {url} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+            try:
+                # Looked up per request: the shared client is recreated if it was closed
+                async with self._loop_state().in_flight:
+                    response = await get_http_client().request(
+                        method=method,
+                        url=url,
+                        headers=request_headers,
+                        params=params,
+                        json=json_data,
+                        timeout=self.timeout,
+                    )
+            except httpx.TimeoutException as e:
+                error_msg = f"BlueAnt API timeout: {url}"
+                if attempt + 1 < attempts:
+                    logger.warning(error_msg)
+                    continue
+                logger.error(error_msg)
+                raise BlueAntClientError(error_msg) from e
+            except httpx.RequestError as e:
+                error_msg = f"BlueAnt API request failed: {e}"
+                if attempt + 1 < attempts:
+                    logger.warning(error_msg)
+                    continue
+                logger.error(error_msg)
+                raise BlueAntClientError(error_msg) from e
 
             if response.status_code >= 400:
                 error_msg = f"BlueAnt API error: {response.status_code} - {response.text}"
+                # Gateway errors are usually transient; other errors are not retried
+                if response.status_code in _RETRY_STATUS_CODES and attempt + 1 < attempts:
+                    logger.warning(error_msg)
+                    continue
                 logger.error(error_msg)
                 raise BlueAntClientError(error_msg, status_code=response.status_code)
 
-            return response.json()
+            return response
 
-        except httpx.TimeoutException as e:
-            error_msg = f"BlueAnt API timeout: {url}"
-            logger.error(error_msg)
-            raise BlueAntClientError(error_msg) from e
-        except httpx.RequestError as e:
-            error_msg = f"BlueAnt API request failed: {e}"
-            logger.error(error_msg)
-            raise BlueAntClientError(error_msg) from e
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        json_data: Optional[dict] = None,
+    ) -> bytes:
+        """
+        Execute HTTP request to BlueAnt API and return the raw response body.
+        Concurrent identical GETs share one in-flight request.
+        """
+        if method != "GET" or json_data is not None:
+            response = await self._send(method, endpoint, params=params, json_data=json_data)
+            return response.content
+
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        in_flight_gets = self._loop_state().in_flight_gets
+        shared = in_flight_gets.get(key)
+        if shared is None:
+            task = asyncio.ensure_future(self._get_body(endpoint, params))
+            shared = in_flight_gets[key] = _SharedRequest(task)
+            task.add_done_callback(lambda done: _forget_in_flight(in_flight_gets, key, done))
+        shared.waiters += 1
+        try:
+            # Shielded: a cancelled caller must not cancel the request for the others
+            return await asyncio.shield(shared.task)
+        except asyncio.CancelledError:
+            if shared.waiters == 1:
+                shared.task.cancel()
+            raise
+        finally:
+            shared.waiters -= 1
+
+    async def _get_body(self, endpoint: str, params: Optional[dict]) -> bytes:
+        response = await self._send("GET", endpoint, params=params)
+        return response.content
+
+    async def _get_cached_list(self, endpoint: str, parser: _ListParser, ttl: float) -> list:
+        """
+        GET a list endpoint through the per-service cache.
+
+        Within ttl seconds the parsed items are reused without a request.
+        After that the request is conditional (If-None-Match with the last
+        ETag), so an unchanged list costs a 304 without body or parsing.
+        Concurrent misses for the same endpoint share one request (not with
+        ttl <= 0, where every call revalidates anyway); failed fetches are
+        not cached. Callers get their own copy of the list.
+        """
+        cached = self._list_cache.get(endpoint)
+        if cached is not None and cached.expires > time.monotonic():
+            return list(cached.items)
+        if ttl <= 0:
+            return list(await self._refresh_list(endpoint, parser, ttl))
+        lock = self._loop_state().list_cache_locks.setdefault(endpoint, asyncio.Lock())
+        async with lock:
+            # Another request may have refreshed it while we waited
+            cached = self._list_cache.get(endpoint)
+            if cached is not None and cached.expires > time.monotonic():
+                return list(cached.items)
+            return list(await self._refresh_list(endpoint, parser, ttl))
+
+    async def _refresh_list(self, endpoint: str, parser: _ListParser, ttl: float) -> tuple:
+        """Fetch (or revalidate) a list endpoint and store it in the cache."""
+        cached = self._list_cache.get(endpoint)
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else None
+        response = await self._send("GET", endpoint, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            items, etag = cached.items, cached.etag
+        else:
+            items, etag = tuple(parser.parse(response.content)), response.headers.get("ETag")
+        self._list_cache[endpoint] = _CachedList(time.monotonic() + ttl, items, etag)
+        return items
 
     # =========================================================================
     # Portfolio Endpoints
@@ -108,22 +355,13 @@ class BlueAntService:
 
     async def get_portfolio(self, portfolio_id: Union[str, int]) -> BlueAntPortfolio:
         """Fetch portfolio by ID."""
-        data = await self._request("GET", f"/v1/portfolios/{portfolio_id}")
-        if isinstance(data, dict) and "portfolio" in data:
-            return BlueAntPortfolio.model_validate(data["portfolio"])
-        return BlueAntPortfolio.model_validate(data)
+        raw = await self._request("GET", f"/v1/portfolios/{portfolio_id}")
+        return _PORTFOLIO.parse(raw)
 
     async def get_all_portfolios(self) -> List[BlueAntPortfolio]:
         """Fetch all portfolios."""
-        data = await self._request("GET", "/v1/portfolios")
-
-        if isinstance(data, dict) and "portfolios" in data:
-            return [BlueAntPortfolio.model_validate(p) for p in data["portfolios"]]
-        elif isinstance(data, list):
-            return [BlueAntPortfolio.model_validate(p) for p in data]
-        elif isinstance(data, dict) and "items" in data:
-            return [BlueAntPortfolio.model_validate(p) for p in data["items"]]
-        return []
+        # Always revalidated (ttl 0), but unchanged lists come back as 304
+        return await self._get_cached_list("/v1/portfolios", _PORTFOLIOS, ttl=0)
 
     async def search_portfolios(self, name: str) -> List[BlueAntPortfolio]:
         """Search portfolios by name (case-insensitive partial match)."""
@@ -133,22 +371,56 @@ class BlueAntService:
 
     async def get_portfolio_projects(self, portfolio_id: str) -> List[BlueAntProject]:
         """Fetch all projects belonging to a portfolio."""
+        # The fallback (filter by portfolioId) only starts if the portfolio
+        # lookup fails, or hedges it if the lookup takes longer than
+        # _FALLBACK_HEDGE_DELAY; it is cancelled once the project IDs are known.
+        lookup = asyncio.ensure_future(self.get_portfolio(portfolio_id))
+        fallback: Optional[asyncio.Task] = None
         try:
-            portfolio = await self.get_portfolio(portfolio_id)
-            if portfolio.project_ids:
-                projects = []
-                for project_id in portfolio.project_ids:
+            done, _ = await asyncio.wait({lookup}, timeout=_FALLBACK_HEDGE_DELAY)
+            if not done:
+                fallback = asyncio.create_task(self._get_projects_by_portfolio(portfolio_id))
+            try:
+                portfolio = await lookup
+            except BlueAntClientError:
+                portfolio = None
+            if portfolio is not None and portfolio.project_ids:
+                if fallback is not None:
+                    fallback.cancel()
+                # One bulk request where supported; whatever it misses is fetched per ID
+                batch = await self._get_projects_batch(portfolio.project_ids) or {}
+                semaphore = asyncio.Semaphore(get_settings().blueant_max_concurrency)
+
+                async def fetch(project_id: Union[str, int]) -> Optional[BlueAntProject]:
+                    if str(project_id) in batch:
+                        return batch[str(project_id)]
                     try:
-                        project = await self.get_project(project_id)
-                        projects.append(project)
+                        async with semaphore:
+                            return await self.get_project(project_id)
                     except BlueAntClientError as e:
                         logger.warning(f"Failed to fetch project {project_id}: {e}")
-                return projects
-        except BlueAntClientError:
-            pass
+                        return None
 
-        # Fallback: Get all projects and filter by portfolio
-        data = await self._request(
+                # Fetch the rest concurrently (bounded); order follows portfolio.project_ids
+                results = await asyncio.gather(
+                    *(fetch(project_id) for project_id in portfolio.project_ids)
+                )
+                return [project for project in results if project is not None]
+
+            if fallback is None:
+                return await self._get_projects_by_portfolio(portfolio_id)
+            return await fallback
+        finally:
+            # Don't leave speculative requests running (e.g. if the caller is
+            # cancelled), and don't let an error from an unused fallback
+            # surface as "never retrieved"
+            lookup.cancel()
+            if fallback is not None and not fallback.cancel() and not fallback.cancelled():
+                fallback.exception()
+
+    async def _get_projects_by_portfolio(self, portfolio_id: str) -> List[BlueAntProject]:
+        """Fallback: get the portfolio's projects via the projects filter."""
+        raw = await self._request(
             "GET", 
             "/v1/projects", 
             params={
@@ -156,41 +428,86 @@ class BlueAntService:
                 "includeMemoFields": "true"
             }
         )
-
-        if isinstance(data, list):
-            return [BlueAntProject.model_validate(p) for p in data]
-        elif isinstance(data, dict) and "items" in data:
-            return [BlueAntProject.model_validate(p) for p in data["items"]]
-        elif isinstance(data, dict) and "projects" in data:
-            return [BlueAntProject.model_validate(p) for p in data["projects"]]
-        return []
+        return _PORTFOLIO_PROJECTS.parse(raw)
 
     # =========================================================================
     # Project Endpoints
     # =========================================================================
 
+    async def _get_projects_batch(
+        self, project_ids: Sequence[Union[str, int]]
+    ) -> Optional[Dict[str, BlueAntProject]]:
+        """
+        Fetch several projects in bulk (/v1/projects?ids=..., _BATCH_IDS_CHUNK
+        IDs per request so long portfolios don't exceed URL limits).
+        Returns the requested projects by string ID (possibly incomplete), or
+        None if this BlueAnt instance does not support the ids filter. The
+        outcome is remembered, so unsupported servers are only probed once.
+        """
+        if self._batch_ids_supported is False:
+            return None
+        chunks = [
+            project_ids[start:start + _BATCH_IDS_CHUNK]
+            for start in range(0, len(project_ids), _BATCH_IDS_CHUNK)
+        ]
+        projects: Dict[str, BlueAntProject] = {}
+        if self._batch_ids_supported is None:
+            # Probe with the first chunk before sending the rest
+            projects.update(await self._get_projects_chunk(chunks.pop(0)) or {})
+            if not self._batch_ids_supported:
+                return projects or None
+        for found in await asyncio.gather(*(self._get_projects_chunk(chunk) for chunk in chunks)):
+            projects.update(found or {})
+        return projects
+
+    async def _get_projects_chunk(
+        self, project_ids: Sequence[Union[str, int]]
+    ) -> Optional[Dict[str, BlueAntProject]]:
+        """One ids-filtered request of _get_projects_batch (None on failure)."""
+        wanted = {str(project_id) for project_id in project_ids}
+        try:
+            raw = await self._request(
+                "GET",
+                "/v1/projects",
+                params={
+                    "ids": ",".join(map(str, project_ids)),
+                    "includeMemoFields": "true",
+                },
+            )
+        except BlueAntClientError as e:
+            # Client errors won't go away on retry: stop probing. Transport
+            # errors and transient statuses leave the probe open.
+            if e.status_code is not None and e.status_code not in _TRANSIENT_STATUS_CODES:
+                self._batch_ids_supported = False
+            return None
+
+        try:
+            projects = {str(project.id): project for project in _PROJECTS.parse(raw)}
+        except ValueError as e:
+            logger.warning(f"BlueAnt bulk project response not usable: {e}")
+            self._batch_ids_supported = False
+            return None
+        # Unknown parameters may be ignored: other projects in the response
+        # mean the filter did not apply, so skip the probe from now on
+        if not projects.keys() <= wanted:
+            self._batch_ids_supported = False
+        elif self._batch_ids_supported is None:
+            self._batch_ids_supported = True
+        return {project_id: project for project_id, project in projects.items() if project_id in wanted}
+
     async def get_project(self, project_id: Union[str, int]) -> BlueAntProject:
         """Fetch single project by ID with memo fields."""
-        data = await self._request(
+        raw = await self._request(
             "GET", 
             f"/v1/projects/{project_id}",
             params={"includeMemoFields": "true"}
         )
-        if isinstance(data, dict) and "project" in data:
-            return BlueAntProject.model_validate(data["project"])
-        return BlueAntProject.model_validate(data)
+        return _PROJECT.parse(raw)
 
     async def get_all_projects(self) -> List[BlueAntProject]:
         """Fetch all projects."""
-        data = await self._request("GET", "/v1/projects")
-
-        if isinstance(data, dict) and "projects" in data:
-            return [BlueAntProject.model_validate(p) for p in data["projects"]]
-        elif isinstance(data, list):
-            return [BlueAntProject.model_validate(p) for p in data]
-        elif isinstance(data, dict) and "items" in data:
-            return [BlueAntProject.model_validate(p) for p in data["items"]]
-        return []
+        raw = await self._request("GET", "/v1/projects")
+        return _PROJECTS.parse(raw)
 
     # =========================================================================
     # Planning Entries
@@ -200,81 +517,49 @@ class BlueAntService:
         self, project_id: Union[str, int]
     ) -> List[BlueAntPlanningEntry]:
         """Fetch planning entries for a project."""
-        data = await self._request(
+        raw = await self._request(
             "GET", f"/v1/projects/{project_id}/planningentries"
         )
-
-        if isinstance(data, dict) and "entries" in data:
-            return [BlueAntPlanningEntry.model_validate(e) for e in data["entries"]]
-        elif isinstance(data, list):
-            return [BlueAntPlanningEntry.model_validate(e) for e in data]
-        elif isinstance(data, dict) and "items" in data:
-            return [BlueAntPlanningEntry.model_validate(e) for e in data["items"]]
-        return []
+        return _PLANNING_ENTRIES.parse(raw)
 
     # =========================================================================
-    # Status Masterdata
+    # Masterdata
     # =========================================================================
 
     async def get_status_masterdata(self) -> List[BlueAntStatus]:
         """Fetch status masterdata (traffic light definitions)."""
-        data = await self._request("GET", "/v1/masterdata/projects/statuses")
-
-        if isinstance(data, list):
-            return [BlueAntStatus.model_validate(s) for s in data]
-        elif isinstance(data, dict) and "items" in data:
-            return [BlueAntStatus.model_validate(s) for s in data["items"]]
-        return []
+        return await self._get_cached_list(
+            "/v1/masterdata/projects/statuses", _STATUSES, get_settings().blueant_masterdata_ttl
+        )
 
     async def get_priority_masterdata(self) -> List[BlueAntPriority]:
         """Fetch priority masterdata."""
-        data = await self._request("GET", "/v1/masterdata/projects/priorities")
-
-        if isinstance(data, list):
-            return [BlueAntPriority.model_validate(p) for p in data]
-        elif isinstance(data, dict) and "items" in data:
-            return [BlueAntPriority.model_validate(p) for p in data["items"]]
-        return []
+        return await self._get_cached_list(
+            "/v1/masterdata/projects/priorities", _PRIORITIES, get_settings().blueant_masterdata_ttl
+        )
 
     async def get_project_type_masterdata(self) -> List[BlueAntProjectType]:
         """Fetch project type masterdata."""
-        data = await self._request("GET", "/v1/masterdata/projects/types")
-
-        if isinstance(data, list):
-            return [BlueAntProjectType.model_validate(t) for t in data]
-        elif isinstance(data, dict) and "items" in data:
-            return [BlueAntProjectType.model_validate(t) for t in data["items"]]
-        return []
+        return await self._get_cached_list(
+            "/v1/masterdata/projects/types", _PROJECT_TYPES, get_settings().blueant_masterdata_ttl
+        )
 
     async def get_department_masterdata(self) -> List[BlueAntDepartment]:
         """Fetch department masterdata."""
-        data = await self._request("GET", "/v1/masterdata/departments")
-
-        if isinstance(data, list):
-            return [BlueAntDepartment.model_validate(d) for d in data]
-        elif isinstance(data, dict) and "items" in data:
-            return [BlueAntDepartment.model_validate(d) for d in data["items"]]
-        elif isinstance(data, dict) and "departments" in data:
-            return [BlueAntDepartment.model_validate(d) for d in data["departments"]]
-        return []
+        return await self._get_cached_list(
+            "/v1/masterdata/departments", _DEPARTMENTS, get_settings().blueant_masterdata_ttl
+        )
 
     async def get_customer_masterdata(self) -> List[BlueAntCustomer]:
         """Fetch customer masterdata."""
-        data = await self._request("GET", "/v1/masterdata/customers")
-
-        if isinstance(data, list):
-            return [BlueAntCustomer.model_validate(c) for c in data]
-        elif isinstance(data, dict) and "items" in data:
-            return [BlueAntCustomer.model_validate(c) for c in data["items"]]
-        elif isinstance(data, dict) and "customers" in data:
-            return [BlueAntCustomer.model_validate(c) for c in data["customers"]]
-        return []
+        return await self._get_cached_list(
+            "/v1/masterdata/customers", _CUSTOMERS, get_settings().blueant_masterdata_ttl
+        )
 
     async def get_all_masterdata(self) -> dict:
-        """Fetch all relevant masterdata in parallel."""
-        import asyncio
-        
-        statuses, priorities, types, departments, customers = await asyncio.gather(
+        """Fetch all relevant masterdata in parallel (failed lists are empty)."""
+        keys = ("statuses", "priorities", "types", "departments", "customers")
+        results = await asyncio.gather(
             self.get_status_masterdata(),
             self.get_priority_masterdata(),
             self.get_project_type_masterdata(),
@@ -282,16 +567,17 @@ class BlueAntService:
             self.get_customer_masterdata(),
             return_exceptions=True
         )
-        
-        return {
-            "statuses": statuses if not isinstance(statuses, Exception) else [],
-            "priorities": priorities if not isinstance(priorities, Exception) else [],
-            "types": types if not isinstance(types, Exception) else [],
-            "departments": departments if not isinstance(departments, Exception) else [],
-            "customers": customers if not isinstance(customers, Exception) else [],
-        }
+
+        masterdata = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to fetch {key} masterdata: {result}")
+                result = []
+            masterdata[key] = result
+        return masterdata
 
 
+@lru_cache
 def get_blueant_service() -> BlueAntService:
-    """Get a BlueAnt service instance with default settings."""
+    """Returns the shared BlueAnt service instance with default settings."""
     return BlueAntService()
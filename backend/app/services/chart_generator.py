@@ -3,9 +3,15 @@ Chart generation utilities using matplotlib.
 Generates charts as PNG bytes for embedding in PowerPoint presentations.
 """
 
+import hashlib
 import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from io import BytesIO
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend for server use
@@ -15,6 +21,7 @@ import matplotlib.patches as mpatches
 import numpy as np
 from matplotlib.figure import Figure
 
+from app.config import get_settings
 from app.models.pptx import (
     ChartType,
     ChartShape,
@@ -25,6 +32,14 @@ from app.models.pptx import (
 
 logger = logging.getLogger(__name__)
 
+# Rendered PNGs by chart content + DPI; charts are pure functions of their
+# data, so identical charts (status donuts, repeated radars) render once
+PNG_CACHE_MAX_ENTRIES = 256
+_png_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+# Worker processes for ChartGenerator.generate_many (created on first use)
+_render_pool: Optional[ProcessPoolExecutor] = None
+
 
 class ChartDesignTokens:
     """Design tokens for consistent chart styling."""
@@ -69,9 +84,24 @@ class ChartDesignTokens:
     TEXT_COLOR = '#333333'
 
 
+# Subplot margins for chart types with fixed label text, as tight_layout()
+# computes them; other chart types carry data-dependent labels (project
+# names, legends) and keep tight_layout()
+FIXED_LAYOUTS: Dict[ChartType, Dict[str, float]] = {
+    # U/I/C/R/DQ axis labels around the polar axes, no title
+    ChartType.RADAR: dict(left=0.3064, right=0.7600, top=0.8498, bottom=0.0649),
+}
+
+
 def rgb_to_tuple(color: RgbColor) -> Tuple[float, float, float]:
     """Convert RgbColor model to matplotlib tuple."""
-    return (color.r / 255, color.g / 255, color.b / 255)
+    return _rgb_floats(color.r, color.g, color.b)
+
+
+@lru_cache(maxsize=1024)
+def _rgb_floats(r: int, g: int, b: int) -> Tuple[float, float, float]:
+    # Charts draw from a few fixed colors; repeated conversions share one tuple
+    return (r / 255, g / 255, b / 255)
 
 
 def get_color_for_index(index: int) -> Tuple[float, float, float]:
@@ -91,6 +121,11 @@ class ChartGenerator:
     def __init__(self, dpi: int = 150):
         self.dpi = dpi
         self.tokens = ChartDesignTokens()
+
+        # Set font properties (global, so every chart type - including the
+        # radar, which creates its own figure - renders with the same fonts)
+        plt.rcParams['font.family'] = self.tokens.FONT_FAMILY
+        plt.rcParams['font.size'] = self.tokens.LABEL_SIZE
     
     def generate(self, chart: ChartShape) -> bytes:
         """
@@ -102,6 +137,12 @@ class ChartGenerator:
         Returns:
             PNG image as bytes
         """
+        key = self._cache_key(chart)
+        png = _png_cache.get(key)
+        if png is not None:
+            _png_cache.move_to_end(key)
+            return png
+
         logger.debug(f"Generating {chart.chart_type.value} chart")
         
         # Select generation method based on chart type
@@ -122,10 +163,44 @@ class ChartGenerator:
             return self._generate_placeholder(chart)
         
         try:
-            return generator_func(chart)
+            png = generator_func(chart)
         except Exception as e:
             logger.error(f"Chart generation failed: {e}", exc_info=True)
             return self._generate_placeholder(chart)
+
+        # Only successful renders are cached
+        _cache_png(key, png)
+        return png
+
+    def generate_many(self, charts: List[ChartShape]) -> List[bytes]:
+        """
+        Generate several charts, rendering the uncached ones in parallel
+        worker processes. Results are returned in order and cached like
+        generate(), so later generate() calls for the same charts are hits.
+        """
+        missing: Dict[bytes, ChartShape] = {}
+        for chart in charts:
+            key = self._cache_key(chart)
+            if key not in _png_cache:
+                missing.setdefault(key, chart)
+
+        pool = _get_render_pool() if len(missing) > 1 else None
+        if pool is not None:
+            try:
+                jobs = [(self.dpi, chart) for chart in missing.values()]
+                for key, png in zip(missing, pool.map(_render_in_worker, jobs)):
+                    if png is not None:
+                        _cache_png(key, png)
+            except Exception as e:
+                # Whatever is still missing is rendered in-process below
+                logger.warning(f"Parallel chart rendering failed: {e}")
+
+        return [self.generate(chart) for chart in charts]
+
+    def _cache_key(self, chart: ChartShape) -> bytes:
+        """Hash of everything that affects the rendered image."""
+        payload = chart.model_dump_json(exclude={"position", "rendered_image_bytes"})
+        return hashlib.blake2b(f"{self.dpi}:{payload}".encode(), digest_size=16).digest()
     
     def _create_figure(
         self,
@@ -139,14 +214,28 @@ class ChartGenerator:
         fig, ax = plt.subplots(figsize=(w, h), facecolor=self.tokens.BACKGROUND_COLOR)
         ax.set_facecolor(self.tokens.BACKGROUND_COLOR)
         
-        # Set font properties
-        plt.rcParams['font.family'] = self.tokens.FONT_FAMILY
-        plt.rcParams['font.size'] = self.tokens.LABEL_SIZE
-        
         return fig, ax
     
-    def _finalize_figure(self, fig: Figure, title: Optional[str] = None) -> bytes:
-        """Add title, adjust layout, and convert to bytes."""
+    def _finalize_figure(
+        self,
+        fig: Figure,
+        title: Optional[str] = None,
+        crop: bool = False,
+        layout: Optional[Dict[str, float]] = None,
+    ) -> bytes:
+        """
+        Add title, adjust layout, and convert to bytes.
+
+        tight_layout() already fits labels and legends into the figure, so
+        the PNG is saved at the full figure size. crop=True trims surrounding
+        whitespace instead (bbox_inches='tight'), which costs an extra draw
+        pass; only charts whose figure size does not match their content
+        (radar) use it.
+
+        layout gives fixed subplot margins (see FIXED_LAYOUTS) for charts
+        whose text does not depend on the data; it replaces tight_layout(),
+        which measures every artist first.
+        """
         if title:
             fig.suptitle(
                 title,
@@ -155,7 +244,10 @@ class ChartGenerator:
                 color=self.tokens.TEXT_COLOR,
             )
         
-        fig.tight_layout()
+        if layout is not None:
+            fig.subplots_adjust(**layout)
+        else:
+            fig.tight_layout()
         
         # Save to bytes
         buffer = BytesIO()
@@ -163,26 +255,36 @@ class ChartGenerator:
             buffer,
             format='png',
             dpi=self.dpi,
-            bbox_inches='tight',
+            bbox_inches='tight' if crop else None,
             facecolor=self.tokens.BACKGROUND_COLOR,
             edgecolor='none',
+            # Fast deflate: the PNGs are embedded in PPTX/DOCX zips anyway
+            pil_kwargs={'compress_level': 1},
         )
         plt.close(fig)
         
         buffer.seek(0)
         return buffer.getvalue()
     
+    def _unpack_data_points(
+        self, data_points: List[ChartDataPoint]
+    ) -> Tuple[List[str], List[float], List[Tuple[float, float, float]]]:
+        """Labels, values and colors (custom or from palette) in one pass."""
+        labels = []
+        values = []
+        colors = []
+        for i, dp in enumerate(data_points):
+            labels.append(dp.label)
+            values.append(dp.value)
+            colors.append(rgb_to_tuple(dp.color) if dp.color else get_color_for_index(i))
+        return labels, values, colors
+    
     def _generate_bar_chart(self, chart: ChartShape) -> bytes:
         """Generate vertical bar chart."""
         fig, ax = self._create_figure()
         
         if chart.data_points:
-            labels = [dp.label for dp in chart.data_points]
-            values = [dp.value for dp in chart.data_points]
-            colors = [
-                rgb_to_tuple(dp.color) if dp.color else get_color_for_index(i)
-                for i, dp in enumerate(chart.data_points)
-            ]
+            labels, values, colors = self._unpack_data_points(chart.data_points)
             
             bars = ax.bar(labels, values, color=colors, edgecolor='white', linewidth=0.5)
             
@@ -221,12 +323,7 @@ class ChartGenerator:
         fig, ax = self._create_figure()
         
         if chart.data_points:
-            labels = [dp.label for dp in chart.data_points]
-            values = [dp.value for dp in chart.data_points]
-            colors = [
-                rgb_to_tuple(dp.color) if dp.color else get_color_for_index(i)
-                for i, dp in enumerate(chart.data_points)
-            ]
+            labels, values, colors = self._unpack_data_points(chart.data_points)
             
             # Reverse for top-to-bottom display
             y_pos = np.arange(len(labels))
@@ -263,12 +360,7 @@ class ChartGenerator:
         fig, ax = self._create_figure(height=6)
         
         if chart.data_points:
-            labels = [dp.label for dp in chart.data_points]
-            values = [dp.value for dp in chart.data_points]
-            colors = [
-                rgb_to_tuple(dp.color) if dp.color else get_color_for_index(i)
-                for i, dp in enumerate(chart.data_points)
-            ]
+            labels, values, colors = self._unpack_data_points(chart.data_points)
             
             # Create pie chart
             wedges, texts, autotexts = ax.pie(
@@ -302,12 +394,7 @@ class ChartGenerator:
         fig, ax = self._create_figure(height=6)
         
         if chart.data_points:
-            labels = [dp.label for dp in chart.data_points]
-            values = [dp.value for dp in chart.data_points]
-            colors = [
-                rgb_to_tuple(dp.color) if dp.color else get_color_for_index(i)
-                for i, dp in enumerate(chart.data_points)
-            ]
+            labels, values, colors = self._unpack_data_points(chart.data_points)
             
             # Create donut chart
             wedges, texts, autotexts = ax.pie(
@@ -463,7 +550,9 @@ class ChartGenerator:
         ax.set_theta_offset(np.pi / 2)
         ax.set_theta_direction(-1)  # Clockwise
         
-        return self._finalize_figure(fig, chart.title)
+        return self._finalize_figure(
+            fig, chart.title, crop=True, layout=FIXED_LAYOUTS[ChartType.RADAR]
+        )
     
     def _generate_line_chart(self, chart: ChartShape) -> bytes:
         """Generate line chart."""
@@ -554,6 +643,69 @@ class ChartGenerator:
         return self._finalize_figure(fig, chart.title)
 
 
+def _cache_png(key: bytes, png: bytes) -> None:
+    _png_cache[key] = png
+    _png_cache.move_to_end(key)
+    if len(_png_cache) > PNG_CACHE_MAX_ENTRIES:
+        _png_cache.popitem(last=False)
+
+
+def _render_in_worker(job: Tuple[int, ChartShape]) -> Optional[bytes]:
+    """Worker process entry point: render one chart, None if it failed."""
+    dpi, chart = job
+    generator = ChartGenerator(dpi=dpi)
+    png = generator.generate(chart)
+    # A failed render returns a placeholder without caching it
+    return png if generator._cache_key(chart) in _png_cache else None
+
+
+def _render_worker_count() -> int:
+    return min(get_settings().chart_render_workers, os.cpu_count() or 1)
+
+
+def _get_render_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Returns the shared chart worker pool, creating it on first use, or None
+    if parallel rendering is disabled. Workers come from a forkserver with
+    this module preloaded, so they start without re-importing matplotlib
+    and without forking the (multi-threaded) server process itself.
+    """
+    global _render_pool
+    workers = _render_worker_count()
+    if workers <= 1:
+        return None
+    if _render_pool is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context("spawn")
+        _render_pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        logger.info(f"Chart render pool started ({workers} workers)")
+    return _render_pool
+
+
+def start_render_pool() -> None:
+    """
+    Start the chart worker processes ahead of the first report (called on
+    application startup), so no request pays for the pool start. Blocks
+    until every worker is up; does nothing if parallel rendering is disabled.
+    """
+    pool = _get_render_pool()
+    if pool is not None:
+        for future in [pool.submit(os.getpid) for _ in range(_render_worker_count())]:
+            future.result()
+
+
+def shutdown_render_pool() -> None:
+    """Stop the chart worker processes (called on application shutdown)."""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown(cancel_futures=True)
+        logger.info("Chart render pool stopped")
+    _render_pool = None
+
+
 # =============================================================================
 # Convenience functions for common chart types
 # =============================================================================
@@ -673,6 +825,11 @@ def create_project_radar_chart(
     )
 
 
+def clear_chart_cache() -> None:
+    """Drop all cached chart PNGs."""
+    _png_cache.clear()
+
+
 def get_chart_generator() -> ChartGenerator:
     """Get a ChartGenerator instance."""
     return ChartGenerator()
@@ -113,7 +113,7 @@ class DocxBuilder:
         section = DocxSection()
 
         # Main title
-        title_style = DocxTextStyle(
+        title_style = DocxTextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.TITLE_SIZE,
             bold=True,
@@ -129,7 +129,7 @@ class DocxBuilder:
         section.content_order.append(("paragraph", 0))
 
         # Subtitle
-        subtitle_style = DocxTextStyle(
+        subtitle_style = DocxTextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.HEADING2_SIZE,
             color=self.tokens.TEXT_DARK,
@@ -146,7 +146,7 @@ class DocxBuilder:
         # Timestamp
         timestamp = datetime.now().strftime("%d.%m.%Y %H:%M")
         timestamp_text = f"{self._get_label('generated')}: {timestamp}"
-        timestamp_style = DocxTextStyle(
+        timestamp_style = DocxTextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.CAPTION_SIZE,
             color=self.tokens.TEXT_LIGHT,
@@ -5,6 +5,7 @@ Transforms raw BlueAnt data into normalized structures for LLM analysis.
 
 import logging
 import re
+import sys
 from collections import Counter
 from datetime import date, datetime
 from typing import List, Optional, Tuple, Union
@@ -31,6 +32,15 @@ from app.models.domain import (
 logger = logging.getLogger(__name__)
 
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a categorical string (owner, department, status, ...).
+    Projects of a portfolio repeat a handful of these values, so they
+    share one string object and compare by identity when grouped.
+    """
+    return sys.intern(value) if value is not None else None
+
+
 class DataNormalizer:
     """
     Transforms raw BlueAnt API data into normalized, LLM-ready structures.
@@ -555,12 +565,12 @@ class DataNormalizer:
             id=str(project.id),
             name=project.name,
             portfolio_id=str(project.portfolio_ids[0]) if project.portfolio_ids else project.portfolio_id,
-            owner_name=project.owner_name,
-            department_name=department_name,
-            customer_name=customer_name,
-            type_name=type_name,
-            priority_name=priority_name,
-            status_label=status_label,
+            owner_name=_intern(project.owner_name),
+            department_name=_intern(department_name),
+            customer_name=_intern(customer_name),
+            type_name=_intern(type_name),
+            priority_name=_intern(priority_name),
+            status_label=_intern(status_label),
             status_color=status_color,
             planned_effort_hours=planned_effort,
             actual_effort_hours=actual_effort,
@@ -592,10 +602,17 @@ class DataNormalizer:
         projects: List[NormalizedProject],
     ) -> NormalizedPortfolio:
         """Create normalized portfolio from portfolio entity and normalized projects."""
+        # One pass over the projects for all portfolio-level aggregates
         status_counter: Counter[Tuple[str, StatusColor]] = Counter()
+        total_planned = total_actual = total_forecast = 0.0
+        critical_project_ids: List[str] = []
         for p in projects:
-            key = (p.status_label or "Unknown", p.status_color)
-            status_counter[key] += 1
+            status_counter[(p.status_label or "Unknown", p.status_color)] += 1
+            total_planned += p.planned_effort_hours
+            total_actual += p.actual_effort_hours
+            total_forecast += p.forecast_effort_hours
+            if p.is_potentially_critical:
+                critical_project_ids.append(p.id)
 
         projects_per_status = [
             ProjectsPerStatus(
@@ -606,12 +623,6 @@ class DataNormalizer:
             for (label, color), count in status_counter.items()
         ]
 
-        total_planned = sum(p.planned_effort_hours for p in projects)
-        total_actual = sum(p.actual_effort_hours for p in projects)
-        total_forecast = sum(p.forecast_effort_hours for p in projects)
-
-        critical_projects = [p for p in projects if p.is_potentially_critical]
-
         return NormalizedPortfolio(
             id=str(portfolio.id),
             name=portfolio.name,
@@ -623,8 +634,8 @@ class DataNormalizer:
             total_planned_effort_hours=total_planned,
             total_actual_effort_hours=total_actual,
             total_forecast_effort_hours=total_forecast,
-            critical_projects_count=len(critical_projects),
-            critical_project_ids=[p.id for p in critical_projects],
+            critical_projects_count=len(critical_project_ids),
+            critical_project_ids=critical_project_ids,
             analysis_timestamp=datetime.now(),
         )
 
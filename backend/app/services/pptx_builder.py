@@ -144,6 +144,10 @@ class PptxBuilder:
                 -p.priority_score,  # Within same status, sort by priority descending
             ),
         )
+        # Render all radars up front (in parallel); the slides then hit the chart cache
+        self.chart_generator.generate_many(
+            [self._project_radar_chart(project_score) for project_score in sorted_projects]
+        )
         for project_score in sorted_projects:
             presentation.slides.append(self._build_project_radar_slide(project_score))
         
@@ -220,7 +224,7 @@ class PptxBuilder:
 
         # Main title
         title_text = slide_spec.title if slide_spec else (self.analysis.portfolio_name or "Portfolio Analysis")
-        title_style = TextStyle(
+        title_style = TextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.TITLE_SIZE,
             bold=True,
@@ -241,7 +245,7 @@ class PptxBuilder:
 
         # Subtitle
         subtitle_text = slide_spec.subtitle if slide_spec and slide_spec.subtitle else self._get_label("title_subtitle")
-        subtitle_style = TextStyle(
+        subtitle_style = TextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.SUBTITLE_SIZE,
             bold=False,
@@ -264,7 +268,7 @@ class PptxBuilder:
         timestamp = datetime.now().strftime("%d.%m.%Y %H:%M")
         timestamp_text = f"{self._get_label('generated')}: {timestamp}"
 
-        timestamp_style = TextStyle(
+        timestamp_style = TextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.CAPTION_SIZE,
             bold=False,
@@ -320,7 +324,7 @@ class PptxBuilder:
                 self.analysis.executive_summary
             )
 
-            summary_style = TextStyle(
+            summary_style = TextStyle.get(
                 font_name=self.tokens.FONT_FAMILY,
                 font_size_pt=self.tokens.BODY_SIZE,
                 color=self.tokens.TEXT_DARK,
@@ -475,7 +479,7 @@ class PptxBuilder:
         ]
 
         for label, pos in quadrant_labels:
-            label_style = TextStyle(
+            label_style = TextStyle.get(
                 font_name=self.tokens.FONT_FAMILY,
                 font_size_pt=self.tokens.CAPTION_SIZE,
                 italic=True,
@@ -507,7 +511,7 @@ class PptxBuilder:
 
         if not critical_scores:
             # No critical projects message
-            no_critical_style = TextStyle(
+            no_critical_style = TextStyle.get(
                 font_name=self.tokens.FONT_FAMILY,
                 font_size_pt=self.tokens.SUBTITLE_SIZE,
                 color=self.tokens.GREEN,
@@ -547,7 +551,7 @@ class PptxBuilder:
                             TableCell(text=str(score.urgency.value)),
                             TableCell(text=str(score.importance.value)),
                             TableCell(text=str(score.risk.value)),
-                            TableCell(text="●", style=TextStyle(color=status_color)),
+                            TableCell(text="●", style=TextStyle.get(color=status_color)),
                         ]
                     )
                 )
@@ -555,13 +559,13 @@ class PptxBuilder:
             table = TableShape(
                 position=Position(x=0.5, y=1.8, width=12.333, height=4.5),
                 rows=table_rows,
-                header_style=TextStyle(
+                header_style=TextStyle.get(
                     font_name=self.tokens.FONT_FAMILY,
                     font_size_pt=self.tokens.BODY_SIZE,
                     bold=True,
                     color=self.tokens.WHITE,
                 ),
-                cell_style=TextStyle(
+                cell_style=TextStyle.get(
                     font_name=self.tokens.FONT_FAMILY,
                     font_size_pt=self.tokens.BODY_SIZE,
                     color=self.tokens.TEXT_DARK,
@@ -678,7 +682,7 @@ class PptxBuilder:
             y_pos = 1.8
             max_clusters = 6
             for i, cluster in enumerate(self.analysis.risk_clusters[:max_clusters]):
-                indicator_style = TextStyle(
+                indicator_style = TextStyle.get(
                     font_name=self.tokens.FONT_FAMILY,
                     font_size_pt=self.tokens.BODY_SIZE + 4,
                     bold=True,
@@ -691,7 +695,7 @@ class PptxBuilder:
                 )
                 shapes.append(indicator_box)
 
-                risk_style = TextStyle(
+                risk_style = TextStyle.get(
                     font_name=self.tokens.FONT_FAMILY,
                     font_size_pt=self.tokens.BODY_SIZE,
                     color=self.tokens.TEXT_DARK,
@@ -706,7 +710,7 @@ class PptxBuilder:
 
                 y_pos += 0.85
         else:
-            no_clusters_style = TextStyle(
+            no_clusters_style = TextStyle.get(
                 font_name=self.tokens.FONT_FAMILY,
                 font_size_pt=self.tokens.BODY_SIZE,
                 color=self.tokens.TEXT_LIGHT,
@@ -741,7 +745,7 @@ class PptxBuilder:
             y_pos = 1.8
             for i, recommendation in enumerate(self.analysis.recommendations[:5]):
                 # Number badge
-                badge_style = TextStyle(
+                badge_style = TextStyle.get(
                     font_name=self.tokens.FONT_FAMILY,
                     font_size_pt=self.tokens.BODY_SIZE + 2,
                     bold=True,
@@ -755,7 +759,7 @@ class PptxBuilder:
                 shapes.append(badge_box)
 
                 # Recommendation text
-                rec_style = TextStyle(
+                rec_style = TextStyle.get(
                     font_name=self.tokens.FONT_FAMILY,
                     font_size_pt=self.tokens.BODY_SIZE,
                     color=self.tokens.TEXT_DARK,
@@ -769,7 +773,7 @@ class PptxBuilder:
 
                 y_pos += 1.0
         else:
-            no_rec_style = TextStyle(
+            no_rec_style = TextStyle.get(
                 font_name=self.tokens.FONT_FAMILY,
                 font_size_pt=self.tokens.BODY_SIZE,
                 color=self.tokens.TEXT_LIGHT,
@@ -974,6 +978,17 @@ class PptxBuilder:
 
         return self._build_project_radar_slide(project)
 
+    def _project_radar_chart(self, project: ProjectScore) -> ChartShape:
+        """U/I/C/R/DQ radar chart for a project's detail slide."""
+        return create_project_radar_chart(
+            project_name=project.project_name[:20],
+            urgency=project.urgency.value,
+            importance=project.importance.value,
+            complexity=project.complexity.value,
+            risk=project.risk.value,
+            data_quality=project.data_quality.value,
+        )
+
     def _build_project_radar_slide(self, project: ProjectScore) -> PptxSlideModel:
         """
         Build a project slide with radar chart and key insights.
@@ -1006,14 +1021,7 @@ class PptxBuilder:
             content_y_offset = 0.35  # Shift content down to make room for banner
 
         # Radar chart on the left
-        radar_chart = create_project_radar_chart(
-            project_name=project.project_name[:20],
-            urgency=project.urgency.value,
-            importance=project.importance.value,
-            complexity=project.complexity.value,
-            risk=project.risk.value,
-            data_quality=project.data_quality.value,
-        )
+        radar_chart = self._project_radar_chart(project)
         radar_y = 1.4 + content_y_offset
         radar_chart.position = Position(x=0.3, y=radar_y, width=5.5, height=5.5)
         
@@ -1039,7 +1047,7 @@ class PptxBuilder:
             font_size = self.tokens.BODY_SIZE
 
         # Key insights on the right side
-        insights_title_style = TextStyle(
+        insights_title_style = TextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.BODY_SIZE + 2,
             bold=True,
@@ -1064,7 +1072,7 @@ class PptxBuilder:
 
         # Bullet points for insights
         y_pos = 2.0 + content_y_offset
-        bullet_style = TextStyle(
+        bullet_style = TextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=font_size,
             color=self.tokens.TEXT_DARK,
@@ -1075,7 +1083,7 @@ class PptxBuilder:
             bullet_box = TextBoxShape(
                 position=Position(x=6.0, y=y_pos, width=0.3, height=0.4),
                 paragraphs=[TextParagraph(runs=[TextRun(text="▸")], alignment="left")],
-                default_style=TextStyle(
+                default_style=TextStyle.get(
                     font_name=self.tokens.FONT_FAMILY,
                     font_size_pt=self.tokens.BODY_SIZE + 1,
                     bold=True,
@@ -1110,7 +1118,7 @@ class PptxBuilder:
             decision_start_y = max(min_decision_y, adjusted_start)
 
             # Add "Benötigte Entscheidungen" header
-            decision_header_style = TextStyle(
+            decision_header_style = TextStyle.get(
                 font_name=self.tokens.FONT_FAMILY,
                 font_size_pt=self.tokens.BODY_SIZE,
                 bold=True,
@@ -1125,7 +1133,7 @@ class PptxBuilder:
             bullet_y = decision_start_y + 0.3
             
             # Add decision point bullets
-            decision_style = TextStyle(
+            decision_style = TextStyle.get(
                 font_name=self.tokens.FONT_FAMILY,
                 font_size_pt=self.tokens.BODY_SIZE - 2,
                 color=self.tokens.RED,
@@ -1149,7 +1157,7 @@ class PptxBuilder:
 
         # Add score summary below the radar chart (left side)
         score_summary = f"Scores: U={project.urgency.value} | I={project.importance.value} | C={project.complexity.value} | R={project.risk.value} | DQ={project.data_quality.value}"
-        score_style = TextStyle(
+        score_style = TextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.CAPTION_SIZE,
             color=self.tokens.TEXT_LIGHT,
@@ -1581,7 +1589,7 @@ class PptxBuilder:
 
     def _create_slide_title(self, text: str, color: Optional[RgbColor] = None) -> TextBoxShape:
         """Create a standardized slide title with optional custom color."""
-        title_style = TextStyle(
+        title_style = TextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.HEADING_SIZE,
             bold=True,
@@ -1610,7 +1618,7 @@ class PptxBuilder:
         shapes = []
 
         # Value text
-        value_style = TextStyle(
+        value_style = TextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.METRIC_SIZE,
             bold=True,
@@ -1624,7 +1632,7 @@ class PptxBuilder:
         shapes.append(value_box)
 
         # Label text
-        label_style = TextStyle(
+        label_style = TextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.BODY_SIZE,
             color=self.tokens.TEXT_DARK,
@@ -1750,7 +1758,7 @@ class PptxBuilder:
         
         Displayed at the top of project slides when data is incomplete.
         """
-        warning_style = TextStyle(
+        warning_style = TextStyle.get(
             font_name=self.tokens.FONT_FAMILY,
             font_size_pt=self.tokens.BODY_SIZE,
             bold=True,
@@ -1870,7 +1878,7 @@ class PptxBuilder:
         prefix_normalized = self._normalize_prefix(prefix)
         
         # Create bold run for prefix
-        bold_style = TextStyle(
+        bold_style = TextStyle.get(
             font_name=default_style.font_name,
             font_size_pt=default_style.font_size_pt,
             bold=True,
@@ -0,0 +1,278 @@
+"""
+Audio cache for text-to-speech output.
+Stores finished MP3 payloads on disk, keyed by a hash of all synthesis inputs,
+so repeated phrases are served without calling the TTS provider again.
+Short phrases are additionally kept in a bounded in-memory LRU.
+The disk tier is capped in size; a SQLite index tracks access times so
+the least recently used files are evicted first.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional, Set
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# In-memory tier limits
+MEMORY_MAX_ENTRIES = 512
+MEMORY_MAX_BYTES = 64 * 1024 * 1024
+# Only short texts (UI phrases, hints) are kept in memory
+MEMORY_MAX_TEXT_LENGTH = 200
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    atime REAL NOT NULL,
+    created REAL NOT NULL
+)
+"""
+
+
+def looks_like_mp3(data: bytes) -> bool:
+    """Plausibility check before caching: ID3 tag or MPEG frame sync, not trivially short."""
+    return len(data) > 128 and (
+        data[:3] == b"ID3" or (data[0] == 0xFF and (data[1] & 0xE0) == 0xE0)
+    )
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form of text for cache keys: NFKC unicode, collapsed whitespace.
+    Punctuation is kept because it changes the spoken intonation.
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def make_cache_key(provider: str, voice: str, rate: str, text: str) -> str:
+    """
+    Build a stable cache key from the synthesis parameters.
+    Only the key uses the normalized text; synthesis still gets the original.
+    """
+    raw = f"{provider}|{voice}|{rate}|{normalize_text(text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    """
+    Two-tier MP3 cache: in-memory LRU in front of disk.
+
+    Files are stored as {cache_dir}/{key}.mp3 and indexed in
+    {cache_dir}/index.sqlite (size, access time). When the files exceed
+    max_bytes, least recently used ones are deleted. Cache failures are
+    logged and never propagated, so TTS keeps working if the disk is unavailable.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        settings = get_settings()
+        self.cache_dir = Path(cache_dir or settings.tts_cache_dir)
+        self.max_bytes = max_bytes or settings.tts_cache_max_bytes
+        self._index_ready = False
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        # Strong references to pending background writes
+        self._pending: Set[asyncio.Task] = set()
+        # Single-flight registry: key -> future resolved with the finished audio
+        self._inflight: Dict[str, "asyncio.Future[Optional[bytes]]"] = {}
+
+    def _memory_get(self, key: str) -> Optional[bytes]:
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+        return data
+
+    def _memory_put(self, key: str, data: bytes) -> None:
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        # Evict least recently used entries until within both limits
+        while self._memory and (
+            len(self._memory) > MEMORY_MAX_ENTRIES or self._memory_bytes > MEMORY_MAX_BYTES
+        ):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.mp3"
+
+    def _index(self) -> sqlite3.Connection:
+        """
+        Open the SQLite index (WAL mode, safe across worker processes).
+        On first use, files cached before the index existed are registered.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.cache_dir / "index.sqlite", timeout=5.0)
+        if not self._index_ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_INDEX_SCHEMA)
+            with conn:
+                for path in self.cache_dir.glob("*.mp3"):
+                    stat = path.stat()
+                    conn.execute(
+                        "INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?)",
+                        (path.stem, stat.st_size, stat.st_mtime, stat.st_mtime),
+                    )
+            self._index_ready = True
+        return conn
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used files until the disk tier fits max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY atime").fetchall():
+            if total <= self.max_bytes:
+                break
+            evicted.append(key)
+            total -= size
+        with conn:
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in evicted])
+        for key in evicted:
+            self._path(key).unlink(missing_ok=True)
+        logger.info("TTS cache evicted %d file(s)", len(evicted))
+
+    def _read(self, key: str) -> Optional[bytes]:
+        try:
+            data = self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        conn = self._index()
+        try:
+            with conn:
+                conn.execute("UPDATE entries SET atime = ? WHERE key = ?", (time.time(), key))
+        finally:
+            conn.close()
+        return data
+
+    def _write(self, key: str, data: bytes) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        # Write to a temp file first so readers never see a partial MP3
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        now = time.time()
+        conn = self._index()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                    (key, len(data), now, now),
+                )
+            self._evict(conn)
+        finally:
+            conn.close()
+
+    async def get(self, key: str, memory: bool = True) -> Optional[bytes]:
+        """
+        Return cached audio for key, or None on miss.
+        Checks memory first, then disk; disk hits are promoted to memory if memory=True.
+        """
+        data = self._memory_get(key)
+        if data is not None:
+            return data
+        try:
+            data = await asyncio.to_thread(self._read, key)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("TTS cache read failed for %s: %s", key, e)
+            return None
+        if data is not None and memory:
+            self._memory_put(key, data)
+        return data
+
+    async def put(self, key: str, data: bytes, memory: bool = True) -> None:
+        """Store audio for key on disk (and in memory if memory=True)."""
+        if not data:
+            return
+        if memory:
+            self._memory_put(key, data)
+        try:
+            await asyncio.to_thread(self._write, key, data)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("TTS cache write failed for %s: %s", key, e)
+
+    def put_in_background(self, key: str, data: bytes, memory: bool = True) -> None:
+        """Schedule put() without blocking the caller (e.g. at the end of a stream)."""
+        task = asyncio.create_task(self.put(key, data, memory=memory))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    # -------------------------------------------------------------------------
+    # Single-flight (deduplicate concurrent synthesis of the same key)
+    # -------------------------------------------------------------------------
+
+    def join(self, key: str) -> "Optional[asyncio.Future[Optional[bytes]]]":
+        """Return the future of an in-flight synthesis for key, if any."""
+        return self._inflight.get(key)
+
+    def begin(self, key: str) -> "asyncio.Future[Optional[bytes]]":
+        """Register the caller as the one synthesizing key and return its future."""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        return future
+
+    def finish(
+        self, key: str, future: "asyncio.Future[Optional[bytes]]", data: Optional[bytes]
+    ) -> None:
+        """
+        Resolve the waiters of a begin() registration. data=None means the
+        synthesis failed; waiters then fall back to synthesizing on their own.
+        Idempotent, and a newer registration for the same key is left alone.
+        """
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.done():
+            future.set_result(data)
+
+    async def tee(
+        self,
+        chunks: AsyncIterator[bytes],
+        key: str,
+        future: "asyncio.Future[Optional[bytes]]",
+        memory: bool = True,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield chunks through unchanged while collecting them for the cache.
+
+        The audio is only cached if the stream completes and looks like MP3.
+        If the client disconnects (the generator is closed/cancelled) or the
+        provider fails mid-stream or returns garbage, nothing is stored, so
+        truncated or invalid audio never ends up in the cache.
+        """
+        buffer = bytearray()
+        completed = False
+        try:
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                yield chunk
+            completed = True
+        finally:
+            if completed and looks_like_mp3(buffer):
+                data = bytes(buffer)
+                self.finish(key, future, data)
+                self.put_in_background(key, data, memory=memory)
+            elif completed:
+                self.finish(key, future, None)
+                logger.warning("TTS stream for %s is not valid MP3, skipping cache", key[:12])
+            else:
+                self.finish(key, future, None)
+                logger.info("TTS stream for %s not completed, skipping cache", key[:12])
+
+
+@lru_cache
+def get_tts_cache() -> TTSCache:
+    """Returns the shared TTS cache instance."""
+    return TTSCache()
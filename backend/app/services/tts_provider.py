@@ -0,0 +1,77 @@
+"""
+TTS Provider - Unified access to text-to-speech backends.
+
+Supported providers:
+- edge-tts (free Microsoft Azure neural voices)
+
+Usage:
+    from app.services.tts_provider import get_tts_provider
+
+    provider = get_tts_provider()
+    async for chunk in provider.synthesize(text, voice, rate):
+        ...
+"""
+
+import asyncio
+import logging
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Protocol
+
+import edge_tts
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class TTSProvider(Protocol):
+    """Protocol defining the interface for TTS providers."""
+
+    # Stable provider name, part of the audio cache key
+    name: str
+    # Human-readable label for /api/tts/voices
+    label: str
+    default_voice: str
+    # Voice descriptions for /api/tts/voices (id, name, description, gender)
+    voices: List[Dict[str, str]]
+
+    def synthesize(self, text: str, voice: str, rate: str) -> AsyncIterator[bytes]:
+        """Yield MP3 chunks as the provider produces them."""
+        ...
+
+
+class EdgeTTSProvider:
+    """edge-tts provider (free Microsoft Azure voices, streamed over a websocket)."""
+
+    name = "edge-tts"
+    label = "edge-tts (Microsoft Azure)"
+    default_voice = "de-DE-KatjaNeural"
+    voices = [
+        {"id": "de-DE-KatjaNeural", "name": "Katja", "description": "Freundliche weibliche Stimme", "gender": "female"},
+        {"id": "de-DE-AmalaNeural", "name": "Amala", "description": "Warme weibliche Stimme", "gender": "female"},
+        {"id": "de-DE-ConradNeural", "name": "Conrad", "description": "Professionelle männliche Stimme", "gender": "male"},
+        {"id": "de-DE-KillianNeural", "name": "Killian", "description": "Ruhige männliche Stimme", "gender": "male"},
+    ]
+
+    async def synthesize(self, text: str, voice: str, rate: str) -> AsyncIterator[bytes]:
+        # Create edge-tts communicate object; its constructor escapes and splits
+        # the text in Python, so keep that CPU work off the event loop
+        communicate = await asyncio.to_thread(
+            edge_tts.Communicate,
+            text=text,
+            voice=voice,
+            rate=rate
+        )
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
+
+@lru_cache
+def get_tts_provider() -> TTSProvider:
+    """Returns the TTS provider selected by settings.tts_provider."""
+    settings = get_settings()
+    logger.info("Initializing TTS provider: %s", settings.tts_provider)
+    if settings.tts_provider == "edge-tts":
+        return EdgeTTSProvider()
+    raise ValueError(f"Unknown TTS provider: {settings.tts_provider}")
@@ -0,0 +1,125 @@
+"""
+Regression tests for single-flight TTS synthesis (app.api.tts).
+"""
+
+import asyncio
+
+import pytest
+
+from app.api import tts
+from app.services.tts_cache import TTSCache
+
+# Plausible MP3 payload (frame sync + enough bytes for looks_like_mp3)
+MP3_CHUNK = b"\xff\xfb" + b"\x00" * 254
+
+
+class FakeProvider:
+    """Provider stub that counts syntheses."""
+
+    name = "fake"
+    label = "Fake"
+    default_voice = "de-DE-KatjaNeural"
+    voices = [{"id": "de-DE-KatjaNeural", "name": "Katja"}]
+
+    def __init__(self):
+        self.calls = 0
+
+    async def synthesize(self, text, voice, rate):
+        self.calls += 1
+        yield MP3_CHUNK
+        yield MP3_CHUNK
+
+
+@pytest.fixture
+def provider(monkeypatch, tmp_path):
+    fake = FakeProvider()
+    cache = TTSCache(cache_dir=str(tmp_path))
+    monkeypatch.setattr(tts, "get_tts_provider", lambda: fake)
+    monkeypatch.setattr(tts, "get_tts_cache", lambda: cache)
+    tts._get_valid_voices.cache_clear()
+    return fake
+
+
+def test_dropped_stream_does_not_block_later_requests(provider):
+    async def scenario():
+        request = tts.TTSRequest(text="Hallo Welt")
+        # Response is created but its body is never iterated (client gone)
+        dropped = await tts.text_to_speech(request)
+        await dropped.background()
+
+        response = await asyncio.wait_for(tts.text_to_speech(request), timeout=2)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        assert body == MP3_CHUNK * 2
+
+    asyncio.run(scenario())
+    assert provider.calls == 2
+
+
+def test_waiter_falls_back_after_timeout(provider, monkeypatch):
+    monkeypatch.setattr(tts, "SINGLE_FLIGHT_TIMEOUT", 0.05)
+
+    async def scenario():
+        cache = tts.get_tts_cache()
+        key = tts.make_cache_key(provider.name, provider.default_voice, "+0%", "Hallo Welt")
+        # Owner that never resolves its registration
+        cache.begin(key)
+
+        audio = await asyncio.wait_for(
+            tts._segment_audio("Hallo Welt", provider.default_voice, "+0%"), timeout=2
+        )
+        try:
+            body = b"".join([chunk async for chunk in audio.chunks])
+        finally:
+            await audio.release()
+        assert body == MP3_CHUNK * 2
+
+    asyncio.run(scenario())
+    assert provider.calls == 1
+
+
+def test_concurrent_requests_share_one_synthesis(provider):
+    async def scenario():
+        owner = await tts._segment_audio("Hallo Welt", provider.default_voice, "+0%")
+        waiter = asyncio.create_task(
+            tts._segment_audio("Hallo Welt", provider.default_voice, "+0%")
+        )
+        # Let the waiter miss the cache and join the owner's synthesis
+        await asyncio.sleep(0.1)
+        body = b"".join([chunk async for chunk in owner.chunks])
+        await owner.release()
+        assert await asyncio.wait_for(waiter, timeout=2) == body
+
+    asyncio.run(scenario())
+    assert provider.calls == 1
+
+
+def test_later_segments_are_prefetched_in_order(monkeypatch, tmp_path):
+    class SlowProvider(FakeProvider):
+        def __init__(self):
+            super().__init__()
+            self.active = self.peak = 0
+
+        async def synthesize(self, text, voice, rate):
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(0.05)
+                yield b"\xff\xfb" + text.encode() + b"\x00" * 200
+            finally:
+                self.active -= 1
+
+    provider = SlowProvider()
+    monkeypatch.setattr(tts, "get_tts_provider", lambda: provider)
+    monkeypatch.setattr(tts, "get_tts_cache", lambda: TTSCache(cache_dir=str(tmp_path)))
+    sentences = [f"Satz Nummer {i} ist lang genug für ein eigenes Segment." for i in range(4)]
+
+    async def scenario():
+        response = await tts.text_to_speech(tts.TTSRequest(text=" ".join(sentences)))
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    body = asyncio.run(scenario())
+    positions = [body.index(sentence.encode()) for sentence in sentences]
+    assert positions == sorted(positions)
+    assert provider.calls == 4
+    assert provider.peak > 1
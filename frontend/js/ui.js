@@ -7,6 +7,11 @@ let currentAudio = null;
 let isSpeaking = false;
 let currentButtonId = null;
 
+// Recently played TTS audio (key -> Blob), so replays skip the backend.
+// The audio for a given text/voice/rate never changes.
+const ttsAudioCache = new Map();
+const TTS_AUDIO_CACHE_MAX = 20;
+
 // Use config from config.js if available (Docker), otherwise fallback to localhost
 const API_BASE = (window.APP_CONFIG && window.APP_CONFIG.API_BASE) || 'http://localhost:8000';
 
@@ -36,25 +41,40 @@ async function speakText(text, buttonId) {
     updateSpeakButton(buttonId, true, true); // Show loading state
 
     try {
-        // Call backend TTS API
-        const response = await fetch(`${API_BASE}/api/tts/speak`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                text: text,
-                voice: 'de-DE-KatjaNeural', // High-quality German female voice
-                rate: '-5%'
-            })
-        });
+        const voice = 'de-DE-KatjaNeural'; // High-quality German female voice
+        const rate = '-5%';
+        const cacheKey = `${voice}|${rate}|${text}`;
+
+        let audioBlob = ttsAudioCache.get(cacheKey);
+        if (audioBlob) {
+            // Mark as most recently used
+            ttsAudioCache.delete(cacheKey);
+        } else {
+            // Call backend TTS API
+            const response = await fetch(`${API_BASE}/api/tts/speak`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    text: text,
+                    voice: voice,
+                    rate: rate
+                })
+            });
 
-        if (!response.ok) {
-            throw new Error(`TTS failed: ${response.status}`);
+            if (!response.ok) {
+                throw new Error(`TTS failed: ${response.status}`);
+            }
+
+            // Get audio blob
+            audioBlob = await response.blob();
+        }
+        ttsAudioCache.set(cacheKey, audioBlob);
+        if (ttsAudioCache.size > TTS_AUDIO_CACHE_MAX) {
+            ttsAudioCache.delete(ttsAudioCache.keys().next().value);
         }
 
-        // Get audio blob and play
-        const audioBlob = await response.blob();
         const audioUrl = URL.createObjectURL(audioBlob);
         
         currentAudio = new Audio(audioUrl);